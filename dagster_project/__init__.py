@@ -3,7 +3,22 @@
 Dagster definitions for Financial Index Analytics Platform.
 """
 
-from dagster import Definitions
+import os
+from dagster import (
+    AssetSelection,
+    DefaultScheduleStatus,
+    DefaultSensorStatus,
+    Definitions,
+    EventLogEntry,
+    RunRequest,
+    ScheduleDefinition,
+    SensorEvaluationContext,
+    asset_sensor,
+    define_asset_job,
+    job,
+    multiprocess_executor,
+)
+from dagster_dbt import DbtCliResource
 from .resources.database import get_postgres_resource
 from .assets import (
     bronze_sp500_constituents_current,
@@ -12,7 +27,142 @@ from .assets import (
     bronze_sp100_constituents_historical,
     bronze_index_prices_base100,
     bronze_stock_valuation_metrics,
+    raw_stock_valuation_metrics,
+    raw_index_prices_base100,
+    dbt_project,
+    financial_index_dbt_assets,
+)
+from .assets.bronze_ingestion import INDEX_PRICES_PARTITIONS
+from .assets.bronze_loader import DATABASE_TAG, PARTITIONS_PER_RUN, TARGET_TABLE_TAG
+from .assets.dbt_transform import dbt_equivalence_tests
+
+# Steps run in parallel processes. Bronze loads are capped per target table
+# (one writer swapping or deleting a table's rows at a time) and overall,
+# so the run never opens more Postgres connections than the server allows.
+executor = multiprocess_executor.configured({
+    "max_concurrent": int(os.getenv("DAGSTER_MAX_CONCURRENT", os.cpu_count() or 1)),
+    "tag_concurrency_limits": [
+        {
+            "key": TARGET_TABLE_TAG,
+            "value": {"applyLimitPerUniqueValue": True},
+            "limit": int(os.getenv("BRONZE_WRITERS_PER_TABLE", 1)),
+        },
+        {
+            "key": DATABASE_TAG,
+            "value": "postgres",
+            "limit": int(os.getenv("BRONZE_MAX_DB_WRITERS", 4)),
+        },
+    ],
+})
+
+bronze_refresh_job = define_asset_job(
+    name="bronze_refresh",
+    selection=AssetSelection.groups("bronze_layer") - AssetSelection.assets(bronze_index_prices_base100),
+    description="Reload every unpartitioned Bronze table from the raw files, in parallel",
+)
+
+# Daily price partitions, loaded by bronze_index_prices_sensor after each
+# acquisition; backfills of a date range run in parallel runs
+bronze_index_prices_job = define_asset_job(
+    name="bronze_index_prices",
+    selection=AssetSelection.assets(bronze_index_prices_base100),
+    description="Reload the index prices of the selected days",
+)
+
+index_prices_acquisition_job = define_asset_job(
+    name="index_prices_acquisition",
+    selection=AssetSelection.assets(raw_index_prices_base100),
+    description="Fetch the missing daily index closes into the raw price file",
+)
+
+# Tags of a run covering a range of partitions, as set on backfill runs
+PARTITION_RANGE_START_TAG = "dagster/asset_partition_range_start"
+PARTITION_RANGE_END_TAG = "dagster/asset_partition_range_end"
+
+# Nightly (UTC), after the US close: fetch the new closes
+nightly_index_prices_acquisition = ScheduleDefinition(
+    job=index_prices_acquisition_job,
+    cron_schedule="15 0 * * *",
+    default_status=DefaultScheduleStatus.RUNNING,
+)
+
+
+def partition_key_ranges(keys: list, wanted: set, max_keys: int) -> list:
+    """(first, last) runs of consecutive `keys` in `wanted`, each at most `max_keys` long."""
+    ranges = []
+    current = None
+    for key in keys:
+        if key not in wanted:
+            current = None
+        elif current is None or current[2] == max_keys:
+            current = [key, key, 1]
+            ranges.append(current)
+        else:
+            current[1] = key
+            current[2] += 1
+    return [(first, last) for first, last, _ in ranges]
+
+
+@asset_sensor(
+    asset_key=raw_index_prices_base100.key,
+    job=bronze_index_prices_job,
+    default_status=DefaultSensorStatus.RUNNING,
+)
+def bronze_index_prices_sensor(context: SensorEvaluationContext, asset_event: EventLogEntry):
+    """
+    Reload into Bronze the days each price acquisition added or revised
+    (new closes, filled gaps, restatements), PARTITIONS_PER_RUN days per
+    run. The dbt models downstream are eager, so the marts pick the days
+    up (or restate from the earliest reloaded one) next.
+    
+    Days never loaded are requested too, so on a new deployment the first
+    acquisition also loads the whole history (about 4,000 partitions, in
+    parallel runs). A Bronze table emptied outside Dagster needs a manual
+    backfill of every partition of bronze_index_prices.
+    """
+    metadata = asset_event.asset_materialization.metadata
+    changed_ranges = metadata["changed_ranges"].value if "changed_ranges" in metadata else []
+    
+    keys = INDEX_PRICES_PARTITIONS.get_partition_keys()
+    materialized = context.instance.get_materialized_partitions(bronze_index_prices_base100.key)
+    wanted = {key for key in keys if key not in materialized}
+    for start, end in changed_ranges:
+        # ISO date keys compare in date order
+        wanted.update(key for key in keys if start <= key <= end)
+    
+    for first, last in partition_key_ranges(keys, wanted, PARTITIONS_PER_RUN):
+        yield RunRequest(
+            run_key=f"{asset_event.run_id}:{first}",
+            tags={PARTITION_RANGE_START_TAG: first, PARTITION_RANGE_END_TAG: last},
+        )
+
+
+# Full rebuild of every dbt model; day to day, models rebuild eagerly
+# after their own Bronze inputs change
+dbt_transform_job = define_asset_job(
+    name="dbt_transform",
+    selection=AssetSelection.assets(financial_index_dbt_assets),
+    description="Build all dbt models (Silver and Gold layers)",
+)
+
+
+# Whole-history dbt tests, which asset builds skip (see EQUIVALENCE_TAG)
+@job(
+    name="dbt_equivalence",
+    description="Check the incremental performance mart against a full recomputation",
 )
+def dbt_equivalence_job():
+    dbt_equivalence_tests()
+
+
+# Weekly (Sunday, UTC), away from the nightly loads: the equivalence tests
+# scan every index's whole history
+weekly_dbt_equivalence = ScheduleDefinition(
+    job=dbt_equivalence_job,
+    cron_schedule="0 3 * * 0",
+    default_status=DefaultScheduleStatus.RUNNING,
+)
+
 
 defs = Definitions(
     assets=[
@@ -22,8 +172,22 @@ defs = Definitions(
         bronze_sp100_constituents_historical,
         bronze_index_prices_base100,
         bronze_stock_valuation_metrics,
+        raw_stock_valuation_metrics,
+        raw_index_prices_base100,
+        financial_index_dbt_assets,
+    ],
+    jobs=[
+        bronze_refresh_job,
+        bronze_index_prices_job,
+        index_prices_acquisition_job,
+        dbt_transform_job,
+        dbt_equivalence_job,
     ],
+    schedules=[nightly_index_prices_acquisition, weekly_dbt_equivalence],
+    sensors=[bronze_index_prices_sensor],
+    executor=executor,
     resources={
         "database": get_postgres_resource(),
+        "dbt": DbtCliResource(project_dir=dbt_project),
     },
 )
\ No newline at end of file
@@ -0,0 +1,226 @@
+# dagster_project/acquisition/fundamentals.py
+"""
+Fundamentals Fetching
+Rate-limited, retrying fetch of valuation fields for a ticker universe.
+
+Plain Python (no Dagster, no provider SDK), so it imports on its own; the
+raw_stock_valuation_metrics asset supplies the fetcher and writes the
+results.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable
+import requests
+
+
+# Valuation and financial fields kept from each ticker's info
+VALUATION_FIELDS = [
+    # Identifiers
+    'symbol',
+    'shortName',
+    'longName',
+    
+    # Valuation metrics
+    'marketCap',
+    'enterpriseValue',
+    'trailingPE',
+    'forwardPE',
+    'priceToBook',
+    'priceToSalesTrailing12Months',
+    'enterpriseToRevenue',
+    'enterpriseToEbitda',
+    'pegRatio',
+    
+    # Profitability
+    'profitMargins',
+    'operatingMargins',
+    'returnOnAssets',
+    'returnOnEquity',
+    
+    # Growth
+    'revenueGrowth',
+    'earningsGrowth',
+    'earningsQuarterlyGrowth',
+    
+    # Dividends
+    'dividendRate',
+    'dividendYield',
+    'payoutRatio',
+    'fiveYearAvgDividendYield',
+    'trailingAnnualDividendRate',
+    'trailingAnnualDividendYield',
+    
+    # Risk metrics
+    'beta',
+    'fiftyTwoWeekLow',
+    'fiftyTwoWeekHigh',
+    'fiftyDayAverage',
+    'twoHundredDayAverage',
+    
+    # Trading metrics
+    'currentPrice',
+    'previousClose',
+    'regularMarketPreviousClose',
+    'volume',
+    'averageVolume',
+    'averageVolume10days',
+    
+    # Size
+    'sharesOutstanding',
+    'floatShares',
+    
+    # Other useful info
+    'currency',
+    'exchange',
+    'quoteType',
+]
+
+# Fields kept as text; every other field is coerced to a number
+TEXT_FIELDS = {'ticker', 'symbol', 'shortName', 'longName', 'currency', 'exchange', 'quoteType', 'data_fetched_at'}
+
+# HTTP statuses worth retrying (rate limited or transient server errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Error text of unknown or delisted tickers, which no retry will fix
+NOT_FOUND_MARKERS = ("404", "not found", "no data found", "delisted")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, holding at most
+    `capacity`. `acquire()` blocks until a token is available.
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchError(Exception):
+    """A ticker's info could not be fetched; `retryable` if worth another try."""
+    
+    def __init__(self, message: str, retryable: bool = True, retry_after: float = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def http_fetcher(base_url: str, timeout: float) -> Callable[[str], dict]:
+    """Fetch `<base_url>/<ticker>` as JSON, one requests.Session per thread."""
+    local = threading.local()
+    
+    def fetch(ticker: str) -> dict:
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        try:
+            response = local.session.get(f"{base_url.rstrip('/')}/{ticker}", timeout=timeout)
+        except requests.RequestException as e:
+            raise FetchError(str(e))
+        
+        if response.status_code != 200:
+            retry_after = response.headers.get("Retry-After")
+            raise FetchError(
+                f"HTTP {response.status_code}: {response.text[:200]}",
+                retryable=response.status_code in RETRYABLE_STATUSES,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None
+            )
+        try:
+            return response.json()
+        except ValueError as e:
+            raise FetchError(f"Invalid JSON: {e}", retryable=False)
+    
+    return fetch
+
+
+def extract_valuation(ticker: str, info) -> dict:
+    """
+    Valuation fields of one ticker's info.
+    
+    Raises a non-retryable FetchError when the provider returned no info
+    (None, a non-object, or none of the fields), as it does for unknown and
+    delisted tickers.
+    """
+    if not isinstance(info, dict) or all(info.get(field) is None for field in VALUATION_FIELDS):
+        raise FetchError(f"No info returned for {ticker}", retryable=False)
+    
+    valuation = {'ticker': ticker}
+    for field in VALUATION_FIELDS:
+        valuation[field] = info.get(field, None)
+    valuation['data_fetched_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return valuation
+
+
+def fetch_ticker_valuation(
+    ticker: str,
+    fetch: Callable[[str], dict],
+    bucket: TokenBucket,
+    max_retries: int,
+    backoff_seconds: float
+) -> tuple:
+    """
+    Fetch valuation fields for one ticker, retrying transient failures with
+    exponential backoff and jitter (or the server's Retry-After).
+    
+    Never raises: any failure of this ticker, expected or not, is returned
+    as its error, so one bad ticker cannot abort the whole refresh.
+    
+    Returns:
+        tuple: (valuation dict or None, error or None, attempts)
+    """
+    for attempt in range(max_retries + 1):
+        bucket.acquire()
+        try:
+            valuation = extract_valuation(ticker, fetch(ticker))
+        except FetchError as e:
+            error = e
+        except Exception as e:
+            # Unexpected provider output fails this ticker only
+            error = FetchError(f"{type(e).__name__}: {e}", retryable=False)
+        else:
+            return valuation, None, attempt + 1
+        
+        if not error.retryable or attempt == max_retries:
+            return None, str(error), attempt + 1
+        delay = error.retry_after or backoff_seconds * 2 ** attempt
+        time.sleep(delay + random.uniform(0, backoff_seconds))
+
+
+def fetch_valuations(
+    tickers: list,
+    fetch: Callable[[str], dict],
+    bucket: TokenBucket,
+    max_workers: int,
+    max_retries: int,
+    backoff_seconds: float
+) -> list:
+    """
+    Fetch every ticker concurrently on a thread pool sharing `bucket`.
+    
+    Returns:
+        list: (valuation dict or None, error or None, attempts) per ticker,
+            in `tickers` order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(
+            lambda ticker: fetch_ticker_valuation(ticker, fetch, bucket, max_retries, backoff_seconds),
+            tickers
+        ))
\ No newline at end of file
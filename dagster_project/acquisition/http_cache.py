@@ -0,0 +1,93 @@
+# dagster_project/acquisition/http_cache.py
+"""
+On-disk HTTP Response Cache
+JSON GET responses stored per request, so reruns and crash recovery of
+acquisition assets do not repeat API calls.
+"""
+
+import hashlib
+import json
+import os
+import time
+import requests
+
+
+class HttpCache:
+    """
+    Cache of JSON GET responses, one file per request under `directory`.
+    
+    Entries are keyed by URL and parameters (minus secrets such as the API
+    token). A fresh entry is served without a call; a stale entry holding
+    an ETag is revalidated with If-None-Match, and a 304 refreshes it.
+    `ttl_seconds=None` on `get` never expires the entry (for immutable
+    ranges such as past price history).
+    
+    Attributes:
+        hits, revalidated, misses: Request counts by outcome, for metadata
+    """
+    
+    def __init__(self, directory: str, ttl_seconds: float, secret_params: tuple = ("api_token",)):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.secret_params = secret_params
+        self.session = requests.Session()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, url: str, params: dict) -> str:
+        key = json.dumps(
+            [url, sorted((k, str(v)) for k, v in params.items() if k not in self.secret_params)]
+        )
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+    
+    def get(self, url: str, params: dict, ttl_seconds: float = -1, timeout: float = 30):
+        """
+        GET `url` as JSON, through the cache.
+        
+        Args:
+            ttl_seconds: Entry lifetime; -1 uses the cache default, None never expires
+        """
+        ttl_seconds = self.ttl_seconds if ttl_seconds == -1 else ttl_seconds
+        path = self._path(url, params)
+        
+        entry = None
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if ttl_seconds is None or time.time() - entry["fetched_at"] < ttl_seconds:
+                self.hits += 1
+                return entry["body"]
+        
+        headers = {"If-None-Match": entry["etag"]} if entry and entry.get("etag") else {}
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        
+        if response.status_code == 304 and entry:
+            self.revalidated += 1
+            entry["fetched_at"] = time.time()
+        else:
+            response.raise_for_status()
+            self.misses += 1
+            entry = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "fetched_at": time.time(),
+                "body": response.json(),
+            }
+        
+        # Write-then-rename, so a crash never leaves a truncated entry
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+        
+        return entry["body"]
+    
+    def stats(self) -> dict:
+        return {
+            "cache_hits": self.hits,
+            "cache_revalidated": self.revalidated,
+            "cache_misses": self.misses,
+            "api_calls": self.revalidated + self.misses,
+        }
\ No newline at end of file
@@ -0,0 +1,149 @@
+# dagster_project/acquisition/prices.py
+"""
+Index Price Fetching
+Gap detection, cached EODHD fetches and merging for the raw index price
+file.
+
+Plain Python (no Dagster), so it imports on its own; the
+raw_index_prices_base100 asset decides what to fetch and writes the file.
+"""
+
+import os
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+from .http_cache import HttpCache
+
+
+# Interior runs of missing weekdays shorter than this are market holidays
+MIN_GAP_WEEKDAYS = 3
+
+
+def find_gaps(dates: pd.Series, start: date, end: date, lookback_days: int = 0) -> list:
+    """
+    Date ranges (inclusive) missing from one index's history in [start, end].
+    
+    Covers the head before the first date, the tail after the last date and
+    interior runs of at least MIN_GAP_WEEKDAYS missing weekdays. With
+    `lookback_days`, the tail also re-covers that many weekdays up to the
+    last date, for restatements.
+    """
+    if dates.empty:
+        return [(start, end)]
+    
+    known = pd.DatetimeIndex(sorted(set(dates)))
+    gaps = []
+    if known[0].date() > start:
+        gaps.append((start, known[0].date() - timedelta(days=1)))
+    
+    missing = pd.bdate_range(known[0], known[-1]).difference(known)
+    if len(missing):
+        # Consecutive missing weekdays form one run
+        run_ids = (pd.Series(missing).diff().dt.days > 3).cumsum()
+        for _, run in pd.Series(missing).groupby(run_ids.values):
+            if len(run) >= MIN_GAP_WEEKDAYS:
+                gaps.append((run.iloc[0].date(), run.iloc[-1].date()))
+    
+    tail_start = known[-1].date() + timedelta(days=1)
+    if lookback_days:
+        tail_start = (known[-1] - pd.offsets.BDay(lookback_days - 1)).date()
+        # The tail re-fetch covers any interior gap it overlaps
+        gaps = [(a, min(b, tail_start - timedelta(days=1))) for a, b in gaps if a < tail_start]
+    if tail_start <= end:
+        gaps.append((tail_start, end))
+    
+    # Weekend-only ranges have nothing to fetch
+    return [(a, b) for a, b in gaps if len(pd.bdate_range(a, b))]
+
+
+def read_price_file(path: str) -> pd.DataFrame:
+    """Raw price file at `path` (empty if missing), with dates normalized to datetime.date."""
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=["date", "index_name", "close", "base_100"])
+    
+    df = pd.read_csv(path)
+    # Older files hold timezone-aware timestamps; the date prefix is the trading day
+    df["date"] = pd.to_datetime(df["date"].astype(str).str[:10]).dt.date
+    return df
+
+
+def fetch_range(
+    cache: HttpCache,
+    base_url: str,
+    symbol: str,
+    start: date,
+    end: date,
+    cache_ttl_seconds: float,
+    timeout: float
+) -> pd.DataFrame:
+    """
+    Daily closes of `symbol` in [start, end] from the EODHD end-of-day API
+    at `base_url`. Ranges ending before today are cached for good.
+    """
+    today = date.today()
+    body = cache.get(
+        f"{base_url.rstrip('/')}/eod/{symbol}",
+        {
+            "from": start.isoformat(),
+            "to": end.isoformat(),
+            "fmt": "json",
+            "api_token": os.getenv("EODHD_API_TOKEN", ""),
+        },
+        ttl_seconds=None if end < today else cache_ttl_seconds,
+        timeout=timeout
+    )
+    df = pd.DataFrame(body, columns=["date", "close"])
+    df["date"] = pd.to_datetime(df["date"]).dt.date
+    return df
+
+
+def merge_prices(existing: pd.DataFrame, fetched: pd.DataFrame) -> tuple:
+    """
+    Merge fetched closes into the existing prices, fetched rows winning.
+    
+    Returns:
+        tuple: (merged prices with base 100 recomputed, sorted dates whose
+            close or base 100 was added or changed)
+    """
+    # Empty frames (no history yet, nothing fetched) carry no column types
+    frames = [df for df in (existing, fetched) if len(df)]
+    merged = pd.concat(frames, ignore_index=True) if frames else existing
+    merged = merged.drop_duplicates(subset=["date", "index_name"], keep="last")
+    merged = with_base_100(merged)
+    
+    before = existing.drop_duplicates(subset=["date", "index_name"], keep="last")
+    compared = merged.merge(before, on=["date", "index_name"], how="left", suffixes=("", "_before"))
+    # base 100 is compared to within float rounding, as files written
+    # elsewhere may compute the ratio in another order
+    changed = (
+        (compared["close"] != compared["close_before"])
+        | ~np.isclose(
+            compared["base_100"].astype(float),
+            compared["base_100_before"].astype(float),
+            rtol=1e-12,
+            atol=0
+        )
+    )
+    return merged, sorted(set(compared.loc[changed, "date"]))
+
+
+def date_ranges(dates: list) -> list:
+    """
+    Collapse sorted dates into [first, last] ISO date ranges, breaking
+    wherever more than a weekend separates two dates.
+    """
+    ranges = []
+    for day in dates:
+        if ranges and (day - date.fromisoformat(ranges[-1][1])).days <= 3:
+            ranges[-1][1] = day.isoformat()
+        else:
+            ranges.append([day.isoformat(), day.isoformat()])
+    return ranges
+
+
+def with_base_100(df: pd.DataFrame) -> pd.DataFrame:
+    """Recompute base 100 per index, normalized to its first close."""
+    df = df.sort_values(["date", "index_name"]).reset_index(drop=True)
+    first_close = df.groupby("index_name")["close"].transform("first")
+    df["base_100"] = (df["close"] / first_close) * 100
+    return df[["date", "index_name", "close", "base_100"]]
@@ -11,6 +11,9 @@ from .bronze_ingestion import (
     bronze_index_prices_base100,
     bronze_stock_valuation_metrics,
 )
+from .fundamentals_acquisition import raw_stock_valuation_metrics
+from .prices_acquisition import raw_index_prices_base100
+from .dbt_transform import dbt_project, financial_index_dbt_assets
 
 __all__ = [
     "bronze_sp500_constituents_current",
@@ -19,4 +22,8 @@ __all__ = [
     "bronze_sp100_constituents_historical",
     "bronze_index_prices_base100",
     "bronze_stock_valuation_metrics",
+    "raw_stock_valuation_metrics",
+    "raw_index_prices_base100",
+    "dbt_project",
+    "financial_index_dbt_assets",
 ]
\ No newline at end of file
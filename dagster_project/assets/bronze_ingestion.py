@@ -2,389 +2,145 @@
 """
 Bronze Layer Ingestion Assets
 Loads raw CSV files into PostgreSQL Bronze tables.
+
+Each asset is a BronzeSpec declaration; the shared loader in
+bronze_loader.py does the reading (Parquet landing copy unless the CSV is
+newer), column mapping and COPY.
 """
 
-import os
-import pandas as pd
-from datetime import datetime
-from dagster import asset, AssetExecutionContext
-from ..resources.database import PostgresResource
+from dagster import DailyPartitionsDefinition
+from .bronze_loader import BronzeSpec, build_bronze_asset
 
 
-# Base paths
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-DATA_RAW_PATH = os.path.join(PROJECT_ROOT, "data", "raw")
+# Column mapping: CSV column -> DB column
+CONSTITUENTS_CURRENT_COLUMNS = {
+    'Code': 'code',
+    'Exchange': 'exchange',
+    'Name': 'name',
+    'Sector': 'sector',
+    'Industry': 'industry',
+    'Weight': 'weight',
+    'IndexCode': 'index_code',
+    'AsOfDate': 'as_of_date',
+}
 
+CONSTITUENTS_HISTORICAL_COLUMNS = {
+    'Code': 'code',
+    'Name': 'name',
+    'StartDate': 'start_date',
+    'EndDate': 'end_date',
+    'IsActiveNow': 'is_active_now',
+    'IsDelisted': 'is_delisted',
+    'IndexCode': 'index_code',
+}
 
-@asset(
-    group_name="bronze_layer",
-    description="Load S&P 500 current constituents from CSV to Bronze table"
-)
-def bronze_sp500_constituents_current(
-    context: AssetExecutionContext,
-    database: PostgresResource
-) -> None:
-    """
-    Loads S&P 500 current constituents CSV into bronze.raw_index_constituents_current.
-    
-    Source: data/raw/indices/sandp_500_constituents_current.csv
-    Target: bronze.raw_index_constituents_current
-    """
-    
-    # Read CSV
-    csv_path = os.path.join(DATA_RAW_PATH, "indices", "sandp_500_constituents_current.csv")
-    context.log.info(f"Reading CSV from: {csv_path}")
-    
-    df = pd.read_csv(csv_path)
-    context.log.info(f"Loaded {len(df)} rows from CSV")
-    
-    # Clear existing data (idempotent loading)
-    delete_query = """
-        DELETE FROM bronze.raw_index_constituents_current 
-        WHERE source_file = %s;
-    """
-    database.execute_query(delete_query, ('sandp_500_constituents_current.csv',))
-    
-    # Prepare data for insertion
-    loaded_at = datetime.now()
-    source_file = 'sandp_500_constituents_current.csv'
-    
-    data_to_insert = []
-    for _, row in df.iterrows():
-        data_to_insert.append((
-            str(row.get('Code', '')),          # code
-            str(row.get('Exchange', '')),      # exchange
-            str(row.get('Name', '')),          # name
-            str(row.get('Sector', '')),        # sector
-            str(row.get('Industry', '')),      # industry
-            str(row.get('Weight', '')),        # weight
-            str(row.get('IndexCode', '')),     # index_code
-            str(row.get('AsOfDate', '')),      # as_of_date
-            loaded_at,                         # loaded_at
-            source_file                        # source_file
-        ))
-    
-    # Bulk insert
-    columns = [
-        'code', 'exchange', 'name', 'sector', 'industry', 
-        'weight', 'index_code', 'as_of_date', 'loaded_at', 'source_file'
-    ]
-    
-    rows_inserted = database.bulk_insert(
-        'bronze.raw_index_constituents_current',
-        columns,
-        data_to_insert
-    )
-    
-    context.log.info(f"✅ Inserted {rows_inserted} rows into bronze.raw_index_constituents_current")
+# CSV is already in long format: date, index_name, close, base_100
+INDEX_PRICES_COLUMNS = {
+    'date': 'date',
+    'index_name': 'index_name',
+    'close': 'close',
+    'base_100': 'base_100',
+}
 
+# One partition per calendar day (UTC) since the base-100 start date, up to
+# and including today (the day an acquisition may have just fetched);
+# weekends and market holidays load no rows
+INDEX_PRICES_PARTITIONS = DailyPartitionsDefinition(start_date="2014-12-31", end_offset=1)
 
-@asset(
-    group_name="bronze_layer",
-    description="Load S&P 100 current constituents from CSV to Bronze table"
-)
-def bronze_sp100_constituents_current(
-    context: AssetExecutionContext,
-    database: PostgresResource
-) -> None:
-    """
-    Loads S&P 100 current constituents CSV into bronze.raw_index_constituents_current.
-    
-    Source: data/raw/indices/sandp_100_constituents_current.csv
-    Target: bronze.raw_index_constituents_current
-    """
-    
-    csv_path = os.path.join(DATA_RAW_PATH, "indices", "sandp_100_constituents_current.csv")
-    context.log.info(f"Reading CSV from: {csv_path}")
-    
-    df = pd.read_csv(csv_path)
-    context.log.info(f"Loaded {len(df)} rows from CSV")
-    
-    # Clear existing data
-    delete_query = """
-        DELETE FROM bronze.raw_index_constituents_current 
-        WHERE source_file = %s;
-    """
-    database.execute_query(delete_query, ('sandp_100_constituents_current.csv',))
-    
-    # Prepare data
-    loaded_at = datetime.now()
-    source_file = 'sandp_100_constituents_current.csv'
-    
-    data_to_insert = []
-    for _, row in df.iterrows():
-        data_to_insert.append((
-            str(row.get('Code', '')),
-            str(row.get('Exchange', '')),
-            str(row.get('Name', '')),
-            str(row.get('Sector', '')),
-            str(row.get('Industry', '')),
-            str(row.get('Weight', '')),
-            str(row.get('IndexCode', '')),
-            str(row.get('AsOfDate', '')),
-            loaded_at,
-            source_file
-        ))
-    
-    columns = [
-        'code', 'exchange', 'name', 'sector', 'industry',
-        'weight', 'index_code', 'as_of_date', 'loaded_at', 'source_file'
-    ]
-    
-    rows_inserted = database.bulk_insert(
-        'bronze.raw_index_constituents_current',
-        columns,
-        data_to_insert
-    )
-    
-    context.log.info(f"✅ Inserted {rows_inserted} rows into bronze.raw_index_constituents_current")
+# CSV columns are camelCase, DB columns are snake_case
+VALUATION_COLUMNS = {
+    'ticker': 'ticker',
+    'shortName': 'short_name',
+    'longName': 'long_name',
+    'marketCap': 'market_cap',
+    'trailingPE': 'trailing_pe',
+    'forwardPE': 'forward_pe',
+    'priceToBook': 'price_to_book',
+    'priceToSalesTrailing12Months': 'price_to_sales_trailing_12_months',
+    'beta': 'beta',
+    'dividendYield': 'dividend_yield',
+    'dividendRate': 'dividend_rate',
+    'profitMargins': 'profit_margins',
+    'returnOnEquity': 'return_on_equity',
+    'returnOnAssets': 'return_on_assets',
+    'revenueGrowth': 'revenue_growth',
+    'earningsGrowth': 'earnings_growth',
+    'fiftyTwoWeekHigh': 'fifty_two_week_high',
+    'fiftyTwoWeekLow': 'fifty_two_week_low',
+    'currentPrice': 'current_price',
+    'volume': 'volume',
+    'data_fetched_at': 'data_fetched_at',
+}
 
 
-@asset(
-    group_name="bronze_layer",
-    description="Load S&P 500 historical constituents from CSV to Bronze table"
+SP500_CONSTITUENTS_CURRENT_SPEC = BronzeSpec(
+    name="bronze_sp500_constituents_current",
+    source_path="indices/sandp_500_constituents_current.csv",
+    target_table="bronze.raw_index_constituents_current",
+    column_map=CONSTITUENTS_CURRENT_COLUMNS,
+    description="Load S&P 500 current constituents from CSV to Bronze table",
 )
-def bronze_sp500_constituents_historical(
-    context: AssetExecutionContext,
-    database: PostgresResource
-) -> None:
-    """
-    Loads S&P 500 historical constituents CSV into bronze.raw_index_constituents_historical.
-    
-    Source: data/raw/indices/sandp_500_constituents_historical.csv
-    Target: bronze.raw_index_constituents_historical
-    """
-    
-    csv_path = os.path.join(DATA_RAW_PATH, "indices", "sandp_500_constituents_historical.csv")
-    context.log.info(f"Reading CSV from: {csv_path}")
-    
-    df = pd.read_csv(csv_path)
-    context.log.info(f"Loaded {len(df)} rows from CSV")
-    
-    # Clear existing data
-    delete_query = """
-        DELETE FROM bronze.raw_index_constituents_historical 
-        WHERE source_file = %s;
-    """
-    database.execute_query(delete_query, ('sandp_500_constituents_historical.csv',))
-    
-    # Prepare data
-    loaded_at = datetime.now()
-    source_file = 'sandp_500_constituents_historical.csv'
-    
-    data_to_insert = []
-    for _, row in df.iterrows():
-        data_to_insert.append((
-            str(row.get('Code', '')),
-            str(row.get('Name', '')),
-            str(row.get('StartDate', '')),
-            str(row.get('EndDate', '')),
-            str(row.get('IsActiveNow', '')),
-            str(row.get('IsDelisted', '')),
-            str(row.get('IndexCode', '')),
-            loaded_at,
-            source_file
-        ))
-    
-    columns = [
-        'code', 'name', 'start_date', 'end_date', 'is_active_now',
-        'is_delisted', 'index_code', 'loaded_at', 'source_file'
-    ]
-    
-    rows_inserted = database.bulk_insert(
-        'bronze.raw_index_constituents_historical',
-        columns,
-        data_to_insert
-    )
-    
-    context.log.info(f"✅ Inserted {rows_inserted} rows into bronze.raw_index_constituents_historical")
 
+SP100_CONSTITUENTS_CURRENT_SPEC = BronzeSpec(
+    name="bronze_sp100_constituents_current",
+    source_path="indices/sandp_100_constituents_current.csv",
+    target_table="bronze.raw_index_constituents_current",
+    column_map=CONSTITUENTS_CURRENT_COLUMNS,
+    description="Load S&P 100 current constituents from CSV to Bronze table",
+)
 
-@asset(
-    group_name="bronze_layer",
-    description="Load S&P 100 historical constituents from CSV to Bronze table"
+SP500_CONSTITUENTS_HISTORICAL_SPEC = BronzeSpec(
+    name="bronze_sp500_constituents_historical",
+    source_path="indices/sandp_500_constituents_historical.csv",
+    target_table="bronze.raw_index_constituents_historical",
+    column_map=CONSTITUENTS_HISTORICAL_COLUMNS,
+    description="Load S&P 500 historical constituents from CSV to Bronze table",
 )
-def bronze_sp100_constituents_historical(
-    context: AssetExecutionContext,
-    database: PostgresResource
-) -> None:
-    """
-    Loads S&P 100 historical constituents CSV into bronze.raw_index_constituents_historical.
-    
-    Source: data/raw/indices/sandp_100_constituents_historical.csv
-    Target: bronze.raw_index_constituents_historical
-    """
-    
-    csv_path = os.path.join(DATA_RAW_PATH, "indices", "sandp_100_constituents_historical.csv")
-    context.log.info(f"Reading CSV from: {csv_path}")
-    
-    df = pd.read_csv(csv_path)
-    context.log.info(f"Loaded {len(df)} rows from CSV")
-    
-    # Clear existing data
-    delete_query = """
-        DELETE FROM bronze.raw_index_constituents_historical 
-        WHERE source_file = %s;
-    """
-    database.execute_query(delete_query, ('sandp_100_constituents_historical.csv',))
-    
-    # Prepare data
-    loaded_at = datetime.now()
-    source_file = 'sandp_100_constituents_historical.csv'
-    
-    data_to_insert = []
-    for _, row in df.iterrows():
-        data_to_insert.append((
-            str(row.get('Code', '')),
-            str(row.get('Name', '')),
-            str(row.get('StartDate', '')),
-            str(row.get('EndDate', '')),
-            str(row.get('IsActiveNow', '')),
-            str(row.get('IsDelisted', '')),
-            str(row.get('IndexCode', '')),
-            loaded_at,
-            source_file
-        ))
-    
-    columns = [
-        'code', 'name', 'start_date', 'end_date', 'is_active_now',
-        'is_delisted', 'index_code', 'loaded_at', 'source_file'
-    ]
-    
-    rows_inserted = database.bulk_insert(
-        'bronze.raw_index_constituents_historical',
-        columns,
-        data_to_insert
-    )
-    
-    context.log.info(f"✅ Inserted {rows_inserted} rows into bronze.raw_index_constituents_historical")
 
-@asset(
-    group_name="bronze_layer",
-    description="Load index prices (base 100) from CSV to Bronze table"
+SP100_CONSTITUENTS_HISTORICAL_SPEC = BronzeSpec(
+    name="bronze_sp100_constituents_historical",
+    source_path="indices/sandp_100_constituents_historical.csv",
+    target_table="bronze.raw_index_constituents_historical",
+    column_map=CONSTITUENTS_HISTORICAL_COLUMNS,
+    description="Load S&P 100 historical constituents from CSV to Bronze table",
 )
-def bronze_index_prices_base100(
-    context: AssetExecutionContext,
-    database: PostgresResource
-) -> None:
-    """
-    Loads index prices CSV into bronze.raw_index_prices_base100.
-    
-    Source: data/raw/prices/index_prices_base100.csv
-    Target: bronze.raw_index_prices_base100
-    
-    CSV format: date, index_name, close, base_100 (already in long format)
-    """
-    
-    csv_path = os.path.join(DATA_RAW_PATH, "prices", "index_prices_base100.csv")
-    context.log.info(f"Reading CSV from: {csv_path}")
-    
-    df = pd.read_csv(csv_path)
-    context.log.info(f"Loaded {len(df)} rows from CSV")
-    
-    # Clear existing data
-    delete_query = "DELETE FROM bronze.raw_index_prices_base100 WHERE source_file = %s;"
-    database.execute_query(delete_query, ('index_prices_base100.csv',))
-    
-    # Prepare data - CSV is already in the right format!
-    loaded_at = datetime.now()
-    source_file = 'index_prices_base100.csv'
-    
-    data_to_insert = []
-    for _, row in df.iterrows():
-        data_to_insert.append((
-            str(row.get('date', '')),           # date
-            str(row.get('index_name', '')),     # index_name
-            str(row.get('close', '')),          # close
-            str(row.get('base_100', '')),       # base_100
-            loaded_at,                          # loaded_at
-            source_file                         # source_file
-        ))
-    
-    columns = ['date', 'index_name', 'close', 'base_100', 'loaded_at', 'source_file']
-    
-    rows_inserted = database.bulk_insert(
-        'bronze.raw_index_prices_base100',
-        columns,
-        data_to_insert
-    )
-    
-    context.log.info(f"✅ Inserted {rows_inserted} rows into bronze.raw_index_prices_base100")
-    
-@asset(
-    group_name="bronze_layer",
-    description="Load stock valuation metrics from CSV to Bronze table"
+
+# Daily partitions: a run (or backfill range) replaces only its own days
+INDEX_PRICES_BASE100_SPEC = BronzeSpec(
+    name="bronze_index_prices_base100",
+    source_path="prices/index_prices_base100.csv",
+    target_table="bronze.raw_index_prices_base100",
+    column_map=INDEX_PRICES_COLUMNS,
+    description="Load index prices (base 100) from CSV to Bronze table",
+    date_column="date",
+    partitions_def=INDEX_PRICES_PARTITIONS,
+    parquet_partitioning=("index_name", "year"),
+    deps=("raw_index_prices_base100",),
 )
-def bronze_stock_valuation_metrics(
-    context: AssetExecutionContext,
-    database: PostgresResource
-) -> None:
-    """
-    Loads stock valuation metrics CSV into bronze.raw_stock_valuation_metrics.
-    
-    Source: data/raw/fundamentals/stock_valuation_metrics.csv
-    Target: bronze.raw_stock_valuation_metrics
-    """
-    
-    csv_path = os.path.join(DATA_RAW_PATH, "fundamentals", "stock_valuation_metrics.csv")
-    context.log.info(f"Reading CSV from: {csv_path}")
-    
-    df = pd.read_csv(csv_path)
-    context.log.info(f"Loaded {len(df)} rows from CSV")
-    
-    # Clear existing data
-    delete_query = "DELETE FROM bronze.raw_stock_valuation_metrics WHERE source_file = %s;"
-    database.execute_query(delete_query, ('stock_valuation_metrics.csv',))
-    
-    # Prepare data - MAP CSV columns (camelCase) to DB columns (snake_case)
-    loaded_at = datetime.now()
-    source_file = 'stock_valuation_metrics.csv'
-    
-    # Column mapping: CSV column -> DB column
-    column_mapping = {
-        'ticker': 'ticker',
-        'shortName': 'short_name',
-        'longName': 'long_name',
-        'marketCap': 'market_cap',
-        'trailingPE': 'trailing_pe',
-        'forwardPE': 'forward_pe',
-        'priceToBook': 'price_to_book',
-        'priceToSalesTrailing12Months': 'price_to_sales_trailing_12_months',
-        'beta': 'beta',
-        'dividendYield': 'dividend_yield',
-        'dividendRate': 'dividend_rate',
-        'profitMargins': 'profit_margins',
-        'returnOnEquity': 'return_on_equity',
-        'returnOnAssets': 'return_on_assets',
-        'revenueGrowth': 'revenue_growth',
-        'earningsGrowth': 'earnings_growth',
-        'fiftyTwoWeekHigh': 'fifty_two_week_high',
-        'fiftyTwoWeekLow': 'fifty_two_week_low',
-        'currentPrice': 'current_price',
-        'volume': 'volume',
-        'data_fetched_at': 'data_fetched_at'
-    }
-    
-    data_to_insert = []
-    for _, row in df.iterrows():
-        row_data = []
-        # Map CSV columns to database columns in correct order
-        for db_col in column_mapping.values():
-            # Find the CSV column that maps to this DB column
-            csv_col = [k for k, v in column_mapping.items() if v == db_col][0]
-            value = row.get(csv_col, '')
-            row_data.append(str(value) if pd.notna(value) else '')
-        
-        row_data.extend([loaded_at, source_file])
-        data_to_insert.append(tuple(row_data))
-    
-    # Database columns in order
-    columns = list(column_mapping.values()) + ['loaded_at', 'source_file']
-    
-    rows_inserted = database.bulk_insert(
-        'bronze.raw_stock_valuation_metrics',
-        columns,
-        data_to_insert
-    )
-    
-    context.log.info(f"✅ Inserted {rows_inserted} rows into bronze.raw_stock_valuation_metrics")
\ No newline at end of file
+
+# Missing valuation fields are stored as empty strings rather than 'nan'
+STOCK_VALUATION_METRICS_SPEC = BronzeSpec(
+    name="bronze_stock_valuation_metrics",
+    source_path="fundamentals/stock_valuation_metrics.csv",
+    target_table="bronze.raw_stock_valuation_metrics",
+    column_map=VALUATION_COLUMNS,
+    description="Load stock valuation metrics from CSV to Bronze table",
+    na_rep="",
+    deps=("raw_stock_valuation_metrics",),
+)
+
+BRONZE_SPECS = [
+    SP500_CONSTITUENTS_CURRENT_SPEC,
+    SP100_CONSTITUENTS_CURRENT_SPEC,
+    SP500_CONSTITUENTS_HISTORICAL_SPEC,
+    SP100_CONSTITUENTS_HISTORICAL_SPEC,
+    INDEX_PRICES_BASE100_SPEC,
+    STOCK_VALUATION_METRICS_SPEC,
+]
+
+bronze_sp500_constituents_current = build_bronze_asset(SP500_CONSTITUENTS_CURRENT_SPEC)
+bronze_sp100_constituents_current = build_bronze_asset(SP100_CONSTITUENTS_CURRENT_SPEC)
+bronze_sp500_constituents_historical = build_bronze_asset(SP500_CONSTITUENTS_HISTORICAL_SPEC)
+bronze_sp100_constituents_historical = build_bronze_asset(SP100_CONSTITUENTS_HISTORICAL_SPEC)
+bronze_index_prices_base100 = build_bronze_asset(INDEX_PRICES_BASE100_SPEC)
+bronze_stock_valuation_metrics = build_bronze_asset(STOCK_VALUATION_METRICS_SPEC)
\ No newline at end of file
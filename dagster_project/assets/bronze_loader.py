@@ -0,0 +1,418 @@
+# dagster_project/assets/bronze_loader.py
+"""
+Spec-driven Bronze Loader
+Maps raw files (Parquet landing copy, or CSV) onto Bronze tables with
+whole-column pandas operations.
+"""
+
+import os
+import time
+from typing import Iterable, Iterator, NamedTuple
+import pandas as pd
+import psutil
+from dagster import (
+    asset,
+    AssetExecutionContext,
+    AssetObservation,
+    BackfillPolicy,
+    Config,
+    Output,
+    PartitionsDefinition,
+)
+from ..resources.database import PostgresResource
+from .bronze_manifest import file_fingerprint, read_manifest, record_manifest, touch_manifest
+from .raw_landing import landing_source, parquet_path, read_parquet_frames
+
+
+# Base paths
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+DATA_RAW_PATH = os.path.join(PROJECT_ROOT, "data", "raw")
+
+# Op tags used by the executor's concurrency limits (see dagster_project/__init__.py)
+DATABASE_TAG = "bronze/database"
+TARGET_TABLE_TAG = "bronze/target_table"
+
+# Partitions loaded per run in a backfill; runs of a backfill execute in parallel
+PARTITIONS_PER_RUN = 31
+
+
+class BronzeSpec(NamedTuple):
+    """
+    Declaration of one raw file -> Bronze table load.
+    
+    Attributes:
+        name: Dagster asset name
+        source_path: CSV path relative to data/raw (e.g., 'prices/index_prices_base100.csv')
+        target_table: Bronze table (e.g., 'bronze.raw_index_prices_base100')
+        column_map: CSV column -> DB column, in target column order
+        description: Asset description shown in the Dagster UI
+        na_rep: Text stored for missing values (Bronze columns are TEXT)
+        date_column: DB date column (ISO text) selecting the rows of a time partition
+        partitions_def: Time partitions of the asset. Each run then reloads only
+            the rows whose `date_column` falls in its partition window
+        parquet_partitioning: Partition columns of the Parquet landing copy
+            (e.g., ('index_name', 'year'))
+        deps: Upstream asset keys that write the raw file
+    """
+    
+    name: str
+    source_path: str
+    target_table: str
+    column_map: dict
+    description: str
+    na_rep: str = "nan"
+    date_column: str = None
+    partitions_def: PartitionsDefinition = None
+    parquet_partitioning: tuple = ()
+    deps: tuple = ()
+    
+    @property
+    def source_file(self) -> str:
+        """File name recorded in the source_file column."""
+        return os.path.basename(self.source_path)
+    
+    @property
+    def csv_path(self) -> str:
+        """Absolute path of the raw CSV."""
+        return os.path.join(DATA_RAW_PATH, self.source_path)
+    
+    @property
+    def parquet_path(self) -> str:
+        """Absolute path of the Parquet landing copy (file or directory)."""
+        return parquet_path(self.csv_path)
+    
+    @property
+    def columns(self) -> list:
+        """
+        Target columns, including the source_file audit column. loaded_at is
+        left to its column default, so the database clock stamps every load.
+        """
+        return list(self.column_map.values()) + ["source_file"]
+
+
+class BronzeLoadConfig(Config):
+    """Run config shared by all Bronze assets."""
+    
+    # Reload even when the source file is unchanged since the last load
+    force: bool = False
+    # Replace the file's rows by swapping in a freshly loaded partition
+    # instead of DELETE + COPY (no dead tuples left behind)
+    swap_partition: bool = True
+    # Stream the CSV in chunks of this many rows, keeping peak memory flat
+    # regardless of file size (0 reads the whole file at once)
+    chunk_rows: int = 0
+
+
+def to_text(series: pd.Series, na_rep: str) -> pd.Series:
+    """Coerce a whole column to TEXT, rendering missing values as `na_rep`."""
+    return series.astype(str).mask(series.isna(), na_rep)
+
+
+def prepare_bronze_frame(df: pd.DataFrame, spec: BronzeSpec) -> pd.DataFrame:
+    """
+    Build the Bronze rows for a raw DataFrame in one pass per column.
+    
+    Columns missing from the source file are loaded as empty strings.
+    """
+    data = {}
+    for csv_col, db_col in spec.column_map.items():
+        if csv_col in df.columns:
+            data[db_col] = to_text(df[csv_col], spec.na_rep)
+        else:
+            data[db_col] = pd.Series("", index=df.index)
+    
+    data["source_file"] = pd.Series(spec.source_file, index=df.index)
+    
+    return pd.DataFrame(data, index=df.index)[spec.columns]
+
+
+class BronzeStream:
+    """
+    Prepared Bronze rows of one raw file, produced chunk by chunk.
+    
+    The Parquet landing copy is read (typed, column-projected, multithreaded)
+    when it exists and is at least as new as the CSV; otherwise the CSV is
+    parsed. With `chunk_rows` set, the
+    source is read `chunk_rows` at a time. CSV chunks keep every value as
+    its source text, since per-chunk type inference could render one column
+    differently from chunk to chunk; without chunking the whole CSV is read
+    with pandas type inference. Iterate once; the counters and peak memory
+    are filled in as chunks are consumed.
+    """
+    
+    def __init__(
+        self,
+        spec: BronzeSpec,
+        chunk_rows: int = 0,
+        date_range: tuple = None
+    ):
+        self.spec = spec
+        self.chunk_rows = chunk_rows
+        self.date_range = date_range
+        self.source_format, self.path = landing_source(spec.csv_path)
+        self.chunks = 0
+        self.rows_read = 0
+        self.prepare_seconds = 0.0
+        self._process = psutil.Process()
+        self.peak_rss_bytes = self._process.memory_info().rss
+    
+    def _read(self) -> Iterable[pd.DataFrame]:
+        if self.source_format == "parquet":
+            return read_parquet_frames(
+                self.path, list(self.spec.column_map), self.chunk_rows, self.spec.date_column, self.date_range
+            )
+        if self.chunk_rows:
+            return pd.read_csv(self.path, chunksize=self.chunk_rows, dtype=str)
+        return [pd.read_csv(self.path)]
+    
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for df in self._read():
+            start = time.perf_counter()
+            rows = prepare_bronze_frame(df, self.spec)
+            self.prepare_seconds += time.perf_counter() - start
+            self.chunks += 1
+            self.rows_read += len(df)
+            self.peak_rss_bytes = max(self.peak_rss_bytes, self._process.memory_info().rss)
+            yield rows
+    
+    def as_metadata(self) -> dict:
+        return {
+            "source_format": self.source_format,
+            "chunk_rows": self.chunk_rows,
+            "chunks": self.chunks,
+            "rows_read": self.rows_read,
+            "prepare_seconds": round(self.prepare_seconds, 3),
+            "peak_rss_mb": round(self.peak_rss_bytes / (1024 * 1024), 1),
+        }
+
+
+def replace_in_bronze(
+    context: AssetExecutionContext,
+    database: PostgresResource,
+    spec: BronzeSpec,
+    rows: Iterable[pd.DataFrame]
+) -> dict:
+    """
+    Swaps the rows of `spec.source_file` for `rows` in one transaction
+    (DELETE + COPY), so readers never see the file's rows missing.
+    
+    Returns:
+        Materialization metadata describing the load throughput
+    """
+    stats = database.replace_rows(
+        spec.target_table,
+        "source_file = %s",
+        rows,
+        params=(spec.source_file,),
+        columns=spec.columns
+    )
+    
+    context.log.info(
+        f"✅ Replaced {stats['deleted']} rows with {stats['rows']} rows in {spec.target_table} "
+        f"({stats['rows_per_sec']} rows/sec)"
+    )
+    return {
+        "target_table": spec.target_table,
+        "load_mode": "replace",
+        "rows_deleted": stats["deleted"],
+        "rows_loaded": stats["rows"],
+        "replace_seconds": stats["seconds"],
+        "rows_per_sec": stats["rows_per_sec"],
+    }
+
+
+def swap_into_bronze(
+    context: AssetExecutionContext,
+    database: PostgresResource,
+    spec: BronzeSpec,
+    rows: Iterable[pd.DataFrame]
+) -> dict:
+    """
+    Load `rows` into a new partition for `spec.source_file` and swap it in
+    for the previous one.
+    
+    Returns:
+        Materialization metadata describing the load throughput
+    """
+    stats = database.swap_partition(spec.target_table, spec.source_file, rows, columns=spec.columns)
+    
+    context.log.info(
+        f"✅ Swapped {stats['rows']} rows into {stats['partition']} "
+        f"({stats['rows_per_sec']} rows/sec, swap {stats['swap_seconds']}s)"
+    )
+    return {
+        "target_table": spec.target_table,
+        "load_mode": "swap",
+        "partition": stats["partition"],
+        "rows_loaded": stats["rows"],
+        "load_seconds": stats["seconds"],
+        "swap_seconds": stats["swap_seconds"],
+        "rows_per_sec": stats["rows_per_sec"],
+    }
+
+
+def load_bronze_window(
+    context: AssetExecutionContext,
+    database: PostgresResource,
+    spec: BronzeSpec,
+    config: BronzeLoadConfig
+) -> Iterator:
+    """
+    Reload only the rows of the run's partition (or partition range).
+    
+    Rows whose `spec.date_column` falls in the partition time window are
+    replaced in one transaction (DELETE + COPY); every other date is left
+    untouched. A window holds a few rows per day, so the partition swap of
+    whole-file loads does not apply. The Parquet copy is read with the
+    window pushed down (year partitions and row groups outside it are
+    skipped); the CSV fallback is scanned and filtered.
+    
+    The manifest records the source fingerprint per window, so a window
+    whose source has not changed since its last load is skipped.
+    """
+    
+    window = context.partition_time_window
+    start, end = window.start.date(), window.end.date()
+    column = spec.date_column
+    manifest_key = f"{spec.source_file}[{start}, {end})"
+    
+    rows = BronzeStream(spec, config.chunk_rows, date_range=(start, end))
+    
+    previous = read_manifest(database, manifest_key)
+    fingerprint = file_fingerprint(rows.path, previous)
+    
+    if previous is not None and fingerprint.content_hash == previous.content_hash and not config.force:
+        if fingerprint != previous:
+            touch_manifest(database, manifest_key, fingerprint)
+        context.log.info(f"⏭️ {spec.source_file} unchanged since [{start}, {end}) was last loaded, skipping")
+        # One observation per partition of the run (a backfill run covers a range)
+        for partition in context.partition_keys:
+            yield AssetObservation(
+                asset_key=context.asset_key,
+                partition=partition,
+                metadata={
+                    **fingerprint.as_metadata(),
+                    "source_file": spec.source_file,
+                    "partition_start": start.isoformat(),
+                    "partition_end": end.isoformat(),
+                    "skipped": True,
+                }
+            )
+        return
+    
+    context.log.info(f"Reloading {column} in [{start}, {end}) from: {rows.path}")
+    
+    # ISO text compares in date order, so no per-row parsing is needed
+    low, high = start.isoformat(), end.isoformat()
+    window_rows = (chunk[(chunk[column] >= low) & (chunk[column] < high)] for chunk in rows)
+    stats = database.replace_rows(
+        spec.target_table,
+        f"source_file = %s AND {column} >= %s AND {column} < %s",
+        window_rows,
+        params=(spec.source_file, low, high),
+        columns=spec.columns
+    )
+    
+    context.log.info(
+        f"✅ Replaced {stats['deleted']} rows with {stats['rows']} rows in {spec.target_table} "
+        f"for [{start}, {end})"
+    )
+    record_manifest(database, manifest_key, spec.target_table, fingerprint, stats["rows"])
+    
+    yield Output(None, metadata={
+        "target_table": spec.target_table,
+        "load_mode": "partition",
+        "partition_start": start.isoformat(),
+        "partition_end": end.isoformat(),
+        "rows_deleted": stats["deleted"],
+        "rows_loaded": stats["rows"],
+        "replace_seconds": stats["seconds"],
+        "rows_per_sec": stats["rows_per_sec"],
+        **fingerprint.as_metadata(),
+        **rows.as_metadata(),
+        **database.connection_stats(),
+        "source_file": spec.source_file,
+    })
+
+
+def load_bronze(
+    context: AssetExecutionContext,
+    database: PostgresResource,
+    spec: BronzeSpec,
+    config: BronzeLoadConfig
+) -> Iterator:
+    """
+    Load `spec.source_file` into its Bronze table.
+    
+    By default the file's partition is rebuilt and swapped in (or, with
+    `swap_partition` off, its rows are deleted and re-inserted). With
+    `chunk_rows` set, the CSV is streamed to the database chunk by
+    chunk. When the file's fingerprint matches the last load, nothing is
+    read or written and an observation is emitted instead of a
+    materialization. Partitioned specs reload only their partition window.
+    """
+    
+    if spec.partitions_def is not None:
+        yield from load_bronze_window(context, database, spec, config)
+        return
+    
+    # Prepare data - whole-column conversion, no per-row Python. Chunks are
+    # read lazily while the load below consumes them
+    rows = BronzeStream(spec, config.chunk_rows)
+    
+    previous = read_manifest(database, spec.source_file)
+    fingerprint = file_fingerprint(rows.path, previous)
+    
+    if previous is not None and fingerprint.content_hash == previous.content_hash and not config.force:
+        if fingerprint != previous:
+            touch_manifest(database, spec.source_file, fingerprint)
+        context.log.info(f"⏭️ {spec.source_file} unchanged since last load, skipping")
+        yield AssetObservation(
+            asset_key=context.asset_key,
+            metadata={**fingerprint.as_metadata(), "source_file": spec.source_file, "skipped": True}
+        )
+        return
+    
+    context.log.info(f"Reading {rows.source_format} from: {rows.path}")
+    
+    if config.swap_partition:
+        metadata = swap_into_bronze(context, database, spec, rows)
+    else:
+        metadata = replace_in_bronze(context, database, spec, rows)
+    
+    context.log.info(f"Loaded {rows.rows_read} rows from {rows.source_format} in {rows.chunks} chunk(s)")
+    record_manifest(database, spec.source_file, spec.target_table, fingerprint, rows.rows_read)
+    
+    yield Output(None, metadata={
+        **metadata,
+        **fingerprint.as_metadata(),
+        **rows.as_metadata(),
+        **database.connection_stats(),
+        "source_file": spec.source_file,
+    })
+
+
+def build_bronze_asset(spec: BronzeSpec):
+    """Create the Dagster asset that loads `spec` into Bronze."""
+    
+    # Output is optional: unchanged files are observed, not re-materialized
+    @asset(
+        name=spec.name,
+        group_name="bronze_layer",
+        description=spec.description,
+        deps=list(spec.deps),
+        output_required=False,
+        op_tags={DATABASE_TAG: "postgres", TARGET_TABLE_TAG: spec.target_table},
+        partitions_def=spec.partitions_def,
+        backfill_policy=(
+            BackfillPolicy.multi_run(PARTITIONS_PER_RUN) if spec.partitions_def is not None else None
+        )
+    )
+    def _bronze_asset(
+        context: AssetExecutionContext,
+        database: PostgresResource,
+        config: BronzeLoadConfig
+    ) -> Iterator:
+        yield from load_bronze(context, database, spec, config)
+    
+    return _bronze_asset
@@ -0,0 +1,118 @@
+# dagster_project/assets/bronze_manifest.py
+"""
+Bronze Load Manifest
+Content fingerprints of raw files, used to skip loads of unchanged files.
+"""
+
+import hashlib
+import os
+from datetime import datetime
+from typing import NamedTuple
+from ..resources.database import PostgresResource
+
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class FileFingerprint(NamedTuple):
+    """Identity of a raw file's contents at load time."""
+    
+    content_hash: str
+    size_bytes: int
+    modified_at: datetime
+    
+    def as_metadata(self) -> dict:
+        return {
+            "content_hash": self.content_hash,
+            "size_bytes": self.size_bytes,
+            "modified_at": self.modified_at.isoformat(),
+        }
+
+
+def file_fingerprint(path: str, previous: FileFingerprint = None) -> FileFingerprint:
+    """
+    Fingerprint a file by SHA-256, size and mtime.
+    
+    A directory (e.g., a partitioned Parquet dataset) is fingerprinted over
+    all its files: their relative paths and contents, total size and latest
+    mtime. When size and mtime match `previous`, its hash is reused instead
+    of re-reading the file(s).
+    """
+    files = _dataset_files(path) if os.path.isdir(path) else [path]
+    stats = [os.stat(f) for f in files]
+    size_bytes = sum(stat.st_size for stat in stats)
+    modified_at = datetime.fromtimestamp(max((stat.st_mtime for stat in stats), default=0))
+    
+    if (previous is not None
+            and previous.size_bytes == size_bytes
+            and previous.modified_at == modified_at):
+        return previous
+    
+    digest = hashlib.sha256()
+    for file in files:
+        if file != path:
+            digest.update(os.path.relpath(file, path).encode("utf-8"))
+        with open(file, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+    
+    return FileFingerprint(digest.hexdigest(), size_bytes, modified_at)
+
+
+def _dataset_files(path: str) -> list:
+    """All files under a directory, in a stable order."""
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def read_manifest(database: PostgresResource, source_file: str) -> FileFingerprint:
+    """Fingerprint recorded for the last successful load of `source_file`, if any."""
+    rows = database.fetch_query(
+        """
+            SELECT content_hash, size_bytes, modified_at
+            FROM bronze.load_manifest
+            WHERE source_file = %s;
+        """,
+        (source_file,)
+    )
+    return FileFingerprint(*rows[0]) if rows else None
+
+
+def record_manifest(
+    database: PostgresResource,
+    source_file: str,
+    target_table: str,
+    fingerprint: FileFingerprint,
+    row_count: int
+) -> None:
+    """Store the fingerprint of a file that was just loaded."""
+    database.execute_query(
+        """
+            INSERT INTO bronze.load_manifest
+                (source_file, target_table, content_hash, size_bytes, modified_at, row_count, loaded_at)
+            VALUES (%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (source_file) DO UPDATE
+            SET target_table = EXCLUDED.target_table,
+                content_hash = EXCLUDED.content_hash,
+                size_bytes = EXCLUDED.size_bytes,
+                modified_at = EXCLUDED.modified_at,
+                row_count = EXCLUDED.row_count,
+                loaded_at = EXCLUDED.loaded_at;
+        """,
+        (source_file, target_table, *fingerprint, row_count)
+    )
+
+
+def touch_manifest(database: PostgresResource, source_file: str, fingerprint: FileFingerprint) -> None:
+    """Refresh the recorded mtime of a file whose contents did not change."""
+    database.execute_query(
+        """
+            UPDATE bronze.load_manifest
+            SET size_bytes = %s, modified_at = %s
+            WHERE source_file = %s;
+        """,
+        (fingerprint.size_bytes, fingerprint.modified_at, source_file)
+    )
@@ -0,0 +1,94 @@
+# dagster_project/assets/dbt_transform.py
+"""
+dbt Transformation Assets
+Every model of financial_index_dbt as a Dagster asset downstream of the
+Bronze assets.
+
+Each dbt source table maps to the Bronze asset(s) that load it, so lineage
+runs raw file -> Bronze -> Silver -> Gold. Models are eager: when a Bronze
+asset materializes, only the models downstream of it are rebuilt, and
+dbt's thread pool builds independent models in parallel.
+"""
+
+import os
+from collections import defaultdict
+from typing import Any, Mapping
+from dagster import AssetExecutionContext, AssetKey, AutomationCondition, op
+from dagster_dbt import DagsterDbtTranslator, DbtCliResource, DbtProject, dbt_assets
+from .bronze_ingestion import BRONZE_SPECS
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+dbt_project = DbtProject(project_dir=os.path.join(PROJECT_ROOT, "financial_index_dbt"))
+# Parse the project into a manifest when running `dagster dev`
+dbt_project.prepare_if_dev()
+
+# Bronze table -> asset keys of the Bronze assets loading it
+BRONZE_ASSETS_BY_TABLE = defaultdict(list)
+for spec in BRONZE_SPECS:
+    BRONZE_ASSETS_BY_TABLE[spec.target_table].append(AssetKey(spec.name))
+
+# Models dbt may build at once
+DBT_THREADS = int(os.getenv("DBT_THREADS", 4))
+
+# Tests recomputing whole histories from scratch (e.g., the incremental
+# performance mart against a full rebuild). Their cost grows with history,
+# so asset builds skip them and a scheduled job runs them instead
+EQUIVALENCE_TAG = "equivalence"
+
+
+class BronzeDbtTranslator(DagsterDbtTranslator):
+    """Ties dbt sources to the Bronze assets and makes every model eager."""
+    
+    def get_asset_key(self, dbt_resource_props: Mapping[str, Any]) -> AssetKey:
+        if dbt_resource_props["resource_type"] == "source":
+            table = f"{dbt_resource_props['schema']}.{dbt_resource_props['name']}"
+            if table in BRONZE_ASSETS_BY_TABLE:
+                return BRONZE_ASSETS_BY_TABLE[table][0]
+        return super().get_asset_key(dbt_resource_props)
+    
+    def get_asset_spec(self, manifest: Mapping[str, Any], unique_id: str, project):
+        spec = super().get_asset_spec(manifest, unique_id, project)
+        # A table loaded by several Bronze assets (e.g., S&P 500 and S&P 100
+        # constituents) depends on all of them, not just the first
+        extra_deps = [
+            key
+            for dep in spec.deps
+            for keys in BRONZE_ASSETS_BY_TABLE.values()
+            if dep.asset_key == keys[0]
+            for key in keys[1:]
+        ]
+        if extra_deps:
+            spec = spec.merge_attributes(deps=extra_deps)
+        return spec
+    
+    def get_automation_condition(self, dbt_resource_props: Mapping[str, Any]) -> AutomationCondition:
+        return AutomationCondition.eager()
+    
+    def get_group_name(self, dbt_resource_props: Mapping[str, Any]) -> str:
+        # staging -> silver_layer, marts/<folder> -> gold_<folder>
+        fqn = dbt_resource_props["fqn"]
+        if len(fqn) > 1 and fqn[1] == "staging":
+            return "silver_layer"
+        if len(fqn) > 3 and fqn[1] == "marts":
+            return f"gold_{fqn[2]}"
+        return "gold_layer"
+
+
+# The equivalence tests stay out of the asset selection (and so out of
+# every eager build and its asset checks)
+@dbt_assets(
+    manifest=dbt_project.manifest_path,
+    exclude=f"tag:{EQUIVALENCE_TAG}",
+    dagster_dbt_translator=BronzeDbtTranslator()
+)
+def financial_index_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource):
+    """Build the selected dbt models (and their tests) in dependency order."""
+    yield from dbt.cli(["build", "--threads", str(DBT_THREADS)], context=context).stream()
+
+
+@op(description="Run the dbt tests that check incremental models against full recomputations")
+def dbt_equivalence_tests(dbt: DbtCliResource) -> None:
+    """Run every test tagged EQUIVALENCE_TAG; fails if any returns rows."""
+    dbt.cli(["test", "--select", f"tag:{EQUIVALENCE_TAG}", "--threads", str(DBT_THREADS)]).wait()
\ No newline at end of file
@@ -0,0 +1,141 @@
+# dagster_project/assets/fundamentals_acquisition.py
+"""
+Fundamentals Acquisition Asset
+Fetches valuation metrics for the ticker universe into data/raw/fundamentals.
+
+Tickers are fetched concurrently by a thread pool. Every request, retries
+included, first takes a token from a shared token bucket, so a refresh is
+bounded by the provider's rate limit rather than by per-call latency.
+"""
+
+import os
+import time
+import pandas as pd
+import yfinance as yf
+from dagster import asset, AssetExecutionContext, Config, Output
+from ..acquisition.fundamentals import (
+    NOT_FOUND_MARKERS,
+    TEXT_FIELDS,
+    FetchError,
+    TokenBucket,
+    fetch_valuations,
+    http_fetcher,
+)
+from .bronze_loader import DATA_RAW_PATH
+from .raw_landing import write_raw
+
+
+FUNDAMENTALS_CSV = os.path.join(DATA_RAW_PATH, "fundamentals", "stock_valuation_metrics.csv")
+FAILED_CSV = os.path.join(DATA_RAW_PATH, "fundamentals", "failed_valuation.csv")
+
+# Constituent files whose tickers make up the universe (current + historical)
+UNIVERSE_FILES = [
+    "indices/sandp_500_constituents_current.csv",
+    "indices/sandp_500_constituents_historical.csv",
+    "indices/sandp_100_constituents_current.csv",
+    "indices/sandp_100_constituents_historical.csv",
+]
+
+
+class FundamentalsConfig(Config):
+    """Run config for the fundamentals acquisition."""
+    
+    # Sustained request rate allowed by the provider, and the burst above it
+    requests_per_second: float = 2.0
+    burst: int = 5
+    max_workers: int = 8
+    max_retries: int = 4
+    backoff_seconds: float = 1.0
+    # HTTP endpoint serving one ticker's info as JSON at <source_url>/<ticker>
+    # (e.g., a local stub server). Empty uses Yahoo Finance via yfinance.
+    source_url: str = ""
+    timeout_seconds: float = 30.0
+
+
+def yfinance_fetcher(ticker: str) -> dict:
+    """Fetch a ticker's info from Yahoo Finance."""
+    try:
+        return yf.Ticker(ticker).info
+    except Exception as e:
+        message = str(e)
+        not_found = any(marker in message.lower() for marker in NOT_FOUND_MARKERS)
+        raise FetchError(message, retryable=not not_found)
+
+
+def load_ticker_universe() -> list:
+    """Sorted unique tickers of the current and historical constituent files."""
+    tickers = set()
+    for path in UNIVERSE_FILES:
+        csv_path = os.path.join(DATA_RAW_PATH, path)
+        if os.path.exists(csv_path):
+            tickers.update(pd.read_csv(csv_path, usecols=['Code'])['Code'].dropna().astype(str))
+    return sorted(tickers)
+
+
+@asset(
+    group_name="acquisition",
+    description="Fetch valuation metrics for every current and historical constituent"
+)
+def raw_stock_valuation_metrics(context: AssetExecutionContext, config: FundamentalsConfig) -> Output:
+    """
+    Fetch valuation metrics concurrently and write stock_valuation_metrics
+    (CSV + Parquet) for bronze_stock_valuation_metrics.
+    """
+    
+    tickers = load_ticker_universe()
+    if config.source_url:
+        fetch = http_fetcher(config.source_url, config.timeout_seconds)
+    else:
+        fetch = yfinance_fetcher
+    bucket = TokenBucket(config.requests_per_second, config.burst)
+    
+    context.log.info(
+        f"📥 Fetching valuation metrics for {len(tickers)} tickers "
+        f"({config.max_workers} workers, {config.requests_per_second} req/s)"
+    )
+    
+    start = time.perf_counter()
+    results = fetch_valuations(
+        tickers, fetch, bucket, config.max_workers, config.max_retries, config.backoff_seconds
+    )
+    seconds = time.perf_counter() - start
+    
+    valuations = [valuation for valuation, _, _ in results if valuation is not None]
+    failed = [
+        {'ticker': ticker, 'error': error}
+        for ticker, (valuation, error, _) in zip(tickers, results)
+        if valuation is None
+    ]
+    attempts = sum(attempts for _, _, attempts in results)
+    
+    context.log.info(f"✅ Fetched {len(valuations)} tickers, ❌ {len(failed)} failed in {seconds:.1f}s")
+    
+    if not valuations:
+        raise RuntimeError(f"No valuation data fetched for {len(tickers)} tickers")
+    
+    # Typed columns for Parquet (providers return e.g. 'Infinity' for some
+    # ratios); fields no ticker returned are dropped, as the bronze loader
+    # fills missing columns
+    valuation_df = pd.DataFrame(valuations)
+    numeric = [c for c in valuation_df.columns if c not in TEXT_FIELDS]
+    valuation_df[numeric] = valuation_df[numeric].apply(pd.to_numeric, errors='coerce')
+    valuation_df = valuation_df.dropna(axis=1, how='all').sort_values('ticker')
+    written = write_raw(valuation_df, FUNDAMENTALS_CSV)
+    if failed:
+        pd.DataFrame(failed).to_csv(FAILED_CSV, index=False)
+    elif os.path.exists(FAILED_CSV):
+        # A clean run leaves no failure list from an earlier run behind
+        os.remove(FAILED_CSV)
+    
+    return Output(None, metadata={
+        "tickers_requested": len(tickers),
+        "tickers_fetched": len(valuations),
+        "tickers_failed": len(failed),
+        "requests": attempts,
+        "retries": attempts - len(tickers),
+        "fetch_seconds": round(seconds, 1),
+        "tickers_per_sec": round(len(tickers) / seconds, 2) if seconds > 0 else None,
+        "requests_per_second_limit": config.requests_per_second,
+        "csv_path": written["csv_path"],
+        "parquet_path": written["parquet_path"],
+    })
\ No newline at end of file
@@ -0,0 +1,119 @@
+# dagster_project/assets/prices_acquisition.py
+"""
+Index Price Acquisition Asset
+Fetches only the missing date ranges of each index from EODHD and merges
+them into data/raw/prices/index_prices_base100.csv (+ Parquet).
+"""
+
+import os
+from datetime import date
+import pandas as pd
+from dagster import asset, AssetExecutionContext, Backoff, Config, Output, RetryPolicy
+from ..acquisition.http_cache import HttpCache
+from ..acquisition.prices import date_ranges, fetch_range, find_gaps, merge_prices, read_price_file
+from .bronze_loader import DATA_RAW_PATH
+from .raw_landing import write_raw
+
+
+PRICES_CSV = os.path.join(DATA_RAW_PATH, "prices", "index_prices_base100.csv")
+HTTP_CACHE_PATH = os.path.join(DATA_RAW_PATH, ".http_cache", "eodhd")
+
+# Starting point for base 100
+START_DATE = "2014-12-31"
+
+# Index name -> EODHD symbol
+INDEX_SYMBOLS = {
+    "S&P 500": "GSPC.INDX",
+    "S&P 100": "OEX.INDX",
+}
+
+
+class IndexPricesConfig(Config):
+    """Run config for the index price acquisition."""
+    
+    # EODHD API root; point at a local mock server for tests
+    base_url: str = "https://eodhd.com/api"
+    # Weekdays up to each index's last stored date that are fetched again,
+    # so closes the provider revises after the fact are picked up
+    restatement_lookback_days: int = 5
+    # Cache lifetime of responses for ranges ending today or later
+    # (ranges entirely in the past never expire)
+    cache_ttl_seconds: int = 6 * 60 * 60
+    timeout_seconds: float = 30.0
+
+
+@asset(
+    group_name="acquisition",
+    description="Fetch missing daily index closes from EODHD and merge them into the raw price file",
+    retry_policy=RetryPolicy(max_retries=3, delay=10, backoff=Backoff.EXPONENTIAL)
+)
+def raw_index_prices_base100(context: AssetExecutionContext, config: IndexPricesConfig) -> Output:
+    """
+    Gap-aware incremental price acquisition.
+    
+    Every response is cached on disk before it is merged, so a retry after
+    a crash replays cached ranges instead of calling the API again. The
+    dates whose prices were added or revised are reported as
+    `changed_ranges`, from which the Bronze partitions to reload are
+    requested (see dagster_project/__init__.py).
+    """
+    
+    existing = read_price_file(PRICES_CSV)
+    cache = HttpCache(HTTP_CACHE_PATH, config.cache_ttl_seconds)
+    start = date.fromisoformat(START_DATE)
+    end = date.today()
+    
+    fetched = []
+    gaps_by_index = {}
+    for index_name, symbol in INDEX_SYMBOLS.items():
+        gaps = find_gaps(
+            existing.loc[existing["index_name"] == index_name, "date"],
+            start,
+            end,
+            config.restatement_lookback_days
+        )
+        gaps_by_index[index_name] = [f"{a} → {b}" for a, b in gaps]
+        for gap_start, gap_end in gaps:
+            context.log.info(f"📡 {index_name} ({symbol}): fetching {gap_start} to {gap_end}")
+            df = fetch_range(
+                cache,
+                config.base_url,
+                symbol,
+                gap_start,
+                gap_end,
+                config.cache_ttl_seconds,
+                config.timeout_seconds
+            )
+            fetched.append(df.assign(index_name=index_name))
+    
+    new_rows = pd.concat(fetched, ignore_index=True) if fetched else existing.iloc[0:0]
+    merged, changed_dates = merge_prices(existing, new_rows)
+    if not changed_dates:
+        # Leave the raw files untouched, so bronze skips them as unchanged
+        context.log.info(f"⏭️ No new or revised prices ({cache.stats()})")
+        return Output(None, metadata={
+            "rows_fetched": len(new_rows),
+            "rows_total": len(existing),
+            "gaps": gaps_by_index,
+            "changed_ranges": [],
+            **cache.stats(),
+        })
+    
+    changed_ranges = date_ranges(changed_dates)
+    context.log.info(
+        f"✅ {len(new_rows)} rows fetched, {len(changed_dates)} days added or revised "
+        f"({changed_ranges}), {len(merged)} rows total ({cache.stats()})"
+    )
+    
+    written = write_raw(merged, PRICES_CSV, partition_cols=("index_name", "year"), date_column="date")
+    
+    return Output(None, metadata={
+        "rows_fetched": len(new_rows),
+        "rows_total": len(merged),
+        "gaps": gaps_by_index,
+        "days_changed": len(changed_dates),
+        "changed_ranges": changed_ranges,
+        **cache.stats(),
+        "csv_path": written["csv_path"],
+        "parquet_path": written["parquet_path"],
+    })
\ No newline at end of file
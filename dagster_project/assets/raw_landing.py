@@ -0,0 +1,141 @@
+# dagster_project/assets/raw_landing.py
+"""
+Raw Landing Zone
+Typed Parquet copies of the raw CSV files in data/raw.
+
+Each raw file `<name>.csv` may have a Parquet sibling `<name>.parquet`:
+a single file, or a hive-partitioned directory (e.g., by index and year
+for prices). The acquisition assets (write_raw) and the acquisition
+notebook write both. Bronze loads read whichever of the two was written
+last: the Parquet copy, with pyarrow's multithreaded scanner, unless the
+CSV is newer (e.g., refreshed on its own), or the CSV when no Parquet
+copy exists.
+"""
+
+import os
+import shutil
+from typing import Iterator
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+def parquet_path(csv_path: str) -> str:
+    """Parquet sibling of a raw CSV path (file or partitioned directory)."""
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def _latest_mtime(path: str) -> float:
+    """Modification time of a file, or of the newest file under a directory."""
+    if not os.path.isdir(path):
+        return os.path.getmtime(path)
+    return max(
+        (os.path.getmtime(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names),
+        default=0.0
+    )
+
+
+def landing_source(csv_path: str) -> tuple:
+    """
+    Format ('parquet' or 'csv') and path of the copy of a raw file to read.
+    
+    The Parquet copy wins when it is at least as new as the CSV, so a CSV
+    refreshed after it is never shadowed by stale Parquet.
+    """
+    path = parquet_path(csv_path)
+    if os.path.exists(path) and (not os.path.exists(csv_path) or _latest_mtime(path) >= _latest_mtime(csv_path)):
+        return "parquet", path
+    return "csv", csv_path
+
+
+def write_raw(
+    df: pd.DataFrame,
+    csv_path: str,
+    partition_cols: tuple = (),
+    date_column: str = None
+) -> dict:
+    """
+    Write an acquired DataFrame to the landing zone as CSV and typed Parquet.
+    
+    Args:
+        df: Acquired rows, with their natural types (dates, floats, ...)
+        csv_path: Destination CSV path; the Parquet copy goes next to it
+        partition_cols: Columns to partition the Parquet copy by. 'year' is
+            derived from `date_column` when it is not a column of `df`
+        date_column: Date column used to derive the 'year' partition
+    
+    Returns:
+        dict with csv_path, parquet_path and rows
+    """
+    os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+    df.to_csv(csv_path, index=False)
+    
+    if "year" in partition_cols and "year" not in df.columns:
+        df = df.assign(year=pd.to_datetime(df[date_column]).dt.year)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    
+    path = parquet_path(csv_path)
+    # A single-file copy becomes a directory once partitioned, and vice versa
+    if partition_cols and os.path.isfile(path):
+        os.remove(path)
+    elif not partition_cols and os.path.isdir(path):
+        shutil.rmtree(path)
+    
+    if partition_cols:
+        # Replaces only the partitions present in `df`
+        pq.write_to_dataset(
+            table,
+            path,
+            partition_cols=list(partition_cols),
+            existing_data_behavior="delete_matching"
+        )
+    else:
+        pq.write_table(table, path)
+    
+    return {"csv_path": csv_path, "parquet_path": path, "rows": len(df)}
+
+
+def read_parquet_frames(
+    path: str,
+    columns: list,
+    batch_rows: int = 0,
+    date_column: str = None,
+    date_range: tuple = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a Parquet landing file or partitioned directory as DataFrames.
+    
+    Only `columns` present in the dataset are read. With `batch_rows`,
+    record batches of at most that many rows are yielded one at a time;
+    otherwise the whole dataset is yielded as one frame.
+    
+    Args:
+        path: Parquet file or hive-partitioned directory
+        columns: Columns to project
+        batch_rows: Max rows per yielded frame (0 for a single frame)
+        date_column: Date column `date_range` applies to
+        date_range: Half-open (start, end) range of dates to read. Prunes
+            'year' partitions outside it and skips row groups whose
+            statistics fall outside it
+    """
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    columns = [c for c in columns if c in dataset.schema.names]
+    
+    filter = None
+    if date_range is not None:
+        start, end = date_range
+        if "year" in dataset.schema.names:
+            filter = (ds.field("year") >= start.year) & (ds.field("year") <= end.year)
+        if date_column in dataset.schema.names:
+            # Bounds in the column's own type (date, timestamp or ISO text)
+            column_type = dataset.schema.field(date_column).type
+            low, high = (pa.scalar(d, pa.date32()).cast(column_type) for d in date_range)
+            in_range = (ds.field(date_column) >= low) & (ds.field(date_column) < high)
+            filter = in_range if filter is None else filter & in_range
+    
+    if batch_rows:
+        for batch in dataset.to_batches(columns=columns, filter=filter, batch_size=batch_rows, use_threads=True):
+            yield batch.to_pandas()
+    else:
+        yield dataset.to_table(columns=columns, filter=filter, use_threads=True).to_pandas()
\ No newline at end of file
@@ -1,19 +1,32 @@
 # dagster/resources/database.py
 """
 Database resource for PostgreSQL connection.
-Provides a reusable connection to the financial_index_db.
+Provides a pool of reusable connections to the financial_index_db.
 """
 
+import csv
+import hashlib
+import io
 import os
+import struct
+import threading
+import time
 from contextlib import contextmanager
-import psycopg2
-from psycopg2.extras import execute_values
-from dagster import ConfigurableResource
+from datetime import datetime, timedelta
+import pandas as pd
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from dagster import ConfigurableResource, InitResourceContext
+from pydantic import PrivateAttr
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# PostgreSQL binary COPY framing (signature, flags, header extension length)
+PGCOPY_HEADER = b"PGCOPY\n\377\r\n\0" + struct.pack("!ii", 0, 0)
+PGCOPY_TRAILER = struct.pack("!h", -1)
+PG_EPOCH = datetime(2000, 1, 1)
+
 
 class PostgresResource(ConfigurableResource):
     """
@@ -28,28 +41,88 @@ class PostgresResource(ConfigurableResource):
     database: str
     user: str
     password: str
+    min_connections: int = 1
+    max_connections: int = 4
+    # Seconds a checkout waits for a free connection once all
+    # `max_connections` are in use
+    pool_timeout_seconds: float = 30.0
+    copy_binary: bool = False
+    copy_buffer_rows: int = 50_000
+    
+    _pool: ThreadedConnectionPool = PrivateAttr(default=None)
+    _pool_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _slots: threading.BoundedSemaphore = PrivateAttr(default=None)
+    _setup_seconds: float = PrivateAttr(default=None)
+    
+    def setup_for_execution(self, context: InitResourceContext) -> None:
+        """Open the pool once so every query in the run reuses its connections."""
+        self._get_pool()
+    
+    def teardown_after_execution(self, context: InitResourceContext) -> None:
+        """Close all pooled connections at the end of the run."""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+    
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Create the connection pool on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                start = time.perf_counter()
+                self._pool = ThreadedConnectionPool(
+                    self.min_connections,
+                    self.max_connections,
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.user,
+                    password=self.password
+                )
+                self._slots = threading.BoundedSemaphore(self.max_connections)
+                self._setup_seconds = time.perf_counter() - start
+            return self._pool
+    
+    def connection_stats(self) -> dict:
+        """Pool settings and the time spent opening its connections."""
+        return {
+            "pool_min_connections": self.min_connections,
+            "pool_max_connections": self.max_connections,
+            "pool_timeout_seconds": self.pool_timeout_seconds,
+            "connection_setup_seconds": (
+                round(self._setup_seconds, 3) if self._setup_seconds is not None else None
+            ),
+        }
     
     @contextmanager
     def get_connection(self):
         """
-        Context manager for database connections.
-        Automatically handles connection cleanup.
+        Context manager for pooled database connections.
+        Commits on success, rolls back on error, and returns
+        the connection to the pool (discarding it if broken).
+        
+        When every connection is checked out, waits up to
+        `pool_timeout_seconds` for one to be returned (the psycopg2 pool
+        itself fails at once), then raises PoolError.
         """
-        conn = psycopg2.connect(
-            host=self.host,
-            port=self.port,
-            database=self.database,
-            user=self.user,
-            password=self.password
-        )
+        pool = self._get_pool()
+        if not self._slots.acquire(timeout=self.pool_timeout_seconds):
+            raise PoolError(
+                f"No database connection free after {self.pool_timeout_seconds}s "
+                f"({self.max_connections} in use)"
+            )
         try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
+            conn = pool.getconn()
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                if not conn.closed:
+                    conn.rollback()
+                raise e
+            finally:
+                pool.putconn(conn, close=bool(conn.closed))
         finally:
-            conn.close()
+            self._slots.release()
     
     def execute_query(self, query: str, params: tuple = None):
         """Execute a single query (INSERT, UPDATE, DELETE)."""
@@ -65,23 +138,189 @@ class PostgresResource(ConfigurableResource):
                 cur.execute(query, params)
                 return cur.fetchall()
     
-    def bulk_insert(self, table: str, columns: list, data: list):
+    def replace_rows(
+        self,
+        table: str,
+        where: str,
+        rows: pd.DataFrame,
+        params: tuple = None,
+        columns: list = None
+    ) -> dict:
         """
-        Bulk insert data using execute_values for performance.
+        Delete the rows matching `where` and COPY `rows` in their place,
+        in a single transaction, so readers never see the table half-empty.
         
         Args:
             table: Table name (e.g., 'bronze.raw_index_constituents_current')
-            columns: List of column names
-            data: List of tuples with values
+            where: SQL predicate selecting the rows to replace (e.g., 'source_file = %s')
+            rows: Replacement rows (DataFrame or iterable of DataFrames)
+            params: Parameters for `where`
+            columns: Target columns (defaults to the DataFrame's column names;
+                required when `rows` is an iterable)
+        
+        Returns:
+            dict with rows, deleted, seconds and rows_per_sec
         """
+        columns = columns or list(rows.columns)
+        
+        start = time.perf_counter()
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                query = f"""
-                    INSERT INTO {table} ({', '.join(columns)})
-                    VALUES %s
-                """
-                execute_values(cur, query, data)
-                return cur.rowcount
+                cur.execute(f"DELETE FROM {table} WHERE {where}", params)
+                deleted = cur.rowcount
+                copied = self._copy(cur, table, columns, rows)
+        seconds = time.perf_counter() - start
+        
+        return {**_load_stats(copied, seconds), "deleted": deleted}
+    
+    def swap_partition(
+        self,
+        table: str,
+        key: str,
+        rows: pd.DataFrame,
+        columns: list = None,
+        key_column: str = "source_file"
+    ) -> dict:
+        """
+        Replace the LIST partition of `table` holding `key` with a freshly
+        loaded one, in a single transaction.
+        
+        Rows are COPYed into a shadow table outside the partition tree, then
+        the old partition is detached and dropped and the shadow attached in
+        its place. The replace is metadata-only for the parent table, so it
+        leaves no dead tuples or index bloat behind. Any rows for `key` still
+        in the `<table>_default` partition (written before the first swap)
+        are removed.
+        
+        Args:
+            table: LIST-partitioned table (e.g., 'bronze.raw_index_constituents_current')
+            key: Partition key value (e.g., 'sandp_500_constituents_current.csv')
+            rows: Replacement rows (DataFrame or iterable of DataFrames)
+            columns: Target columns (defaults to the DataFrame's column names;
+                required when `rows` is an iterable)
+            key_column: The table's partition key column
+        
+        Returns:
+            dict with rows, seconds, rows_per_sec, swap_seconds and partition
+        """
+        columns = columns or list(rows.columns)
+        partition = _partition_name(table, key)
+        shadow = partition + "_new"
+        
+        start = time.perf_counter()
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {shadow};")
+                cur.execute(f"CREATE TABLE {shadow} (LIKE {table} INCLUDING DEFAULTS);")
+                # Lets ATTACH skip its validation scan of the new partition
+                cur.execute(
+                    f"ALTER TABLE {shadow} ADD CONSTRAINT partition_key "
+                    f"CHECK ({key_column} IS NOT NULL AND {key_column} = %s);",
+                    (key,)
+                )
+                copied = self._copy(cur, shadow, columns, rows)
+                
+                swap_start = time.perf_counter()
+                cur.execute("SELECT to_regclass(%s), to_regclass(%s);", (partition, f"{table}_default"))
+                existing, default = cur.fetchone()
+                if existing:
+                    cur.execute(f"ALTER TABLE {table} DETACH PARTITION {partition};")
+                    cur.execute(f"DROP TABLE {partition};")
+                if default:
+                    cur.execute(f"DELETE FROM {table}_default WHERE {key_column} = %s;", (key,))
+                cur.execute(f"ALTER TABLE {shadow} RENAME TO {partition.split('.')[-1]};")
+                cur.execute(f"ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES IN (%s);", (key,))
+                swap_seconds = time.perf_counter() - swap_start
+        seconds = time.perf_counter() - start
+        
+        return {
+            **_load_stats(copied, seconds),
+            "swap_seconds": round(swap_seconds, 3),
+            "partition": partition,
+        }
+    
+    def _copy(
+        self,
+        cur,
+        table: str,
+        columns: list,
+        source
+    ) -> int:
+        """
+        Run COPY ... FROM STDIN on an open cursor; returns rows copied.
+        
+        `source` is a DataFrame or an iterable of DataFrames (e.g., chunks
+        of a CSV being read), consumed one at a time. Each is serialized in
+        slices of `copy_buffer_rows`, so only one slice is held in memory as
+        CSV/binary at a time. With `copy_binary`, values must be str (TEXT
+        columns) or naive datetime (TIMESTAMP).
+        """
+        if self.copy_binary:
+            options = "FORMAT binary"
+        else:
+            options = "FORMAT csv"
+        query = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH ({options})"
+        
+        frames = [source] if isinstance(source, pd.DataFrame) else source
+        rows = 0
+        for frame in frames:
+            for offset in range(0, len(frame), self.copy_buffer_rows):
+                chunk = frame.iloc[offset:offset + self.copy_buffer_rows]
+                buffer = _encode_binary(chunk) if self.copy_binary else _encode_csv(chunk)
+                cur.copy_expert(query, buffer)
+                rows += cur.rowcount
+        return rows
+
+
+def _load_stats(rows: int, seconds: float) -> dict:
+    """Throughput summary for a load."""
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 3),
+        "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def _partition_name(table: str, key: str) -> str:
+    """Stable, identifier-safe partition name for one key of a LIST-partitioned table."""
+    return f"{table}_p_{hashlib.md5(key.encode('utf-8')).hexdigest()[:10]}"
+
+
+def _encode_csv(df: pd.DataFrame) -> io.StringIO:
+    """
+    Serialize a DataFrame slice as headerless CSV for COPY.
+    
+    Text is quoted, since COPY reads an unquoted empty field as NULL: an
+    empty string (e.g., a missing valuation field) is stored as ''.
+    """
+    buffer = io.StringIO()
+    df.to_csv(buffer, header=False, index=False, quoting=csv.QUOTE_NONNUMERIC)
+    buffer.seek(0)
+    return buffer
+
+
+def _encode_binary(df: pd.DataFrame) -> io.BytesIO:
+    """Serialize a DataFrame slice in PostgreSQL binary COPY format."""
+    buffer = io.BytesIO()
+    buffer.write(PGCOPY_HEADER)
+    field_count = struct.pack("!h", len(df.columns))
+    
+    for row in df.itertuples(index=False, name=None):
+        buffer.write(field_count)
+        for value in row:
+            if pd.isna(value):
+                buffer.write(struct.pack("!i", -1))
+            elif isinstance(value, datetime):
+                micros = (value - PG_EPOCH) // timedelta(microseconds=1)
+                buffer.write(struct.pack("!iq", 8, micros))
+            else:
+                data = str(value).encode("utf-8")
+                buffer.write(struct.pack("!i", len(data)))
+                buffer.write(data)
+    
+    buffer.write(PGCOPY_TRAILER)
+    buffer.seek(0)
+    return buffer
 
 
 def get_postgres_resource() -> PostgresResource:
@@ -93,5 +332,8 @@ def get_postgres_resource() -> PostgresResource:
         port=int(os.getenv("DB_PORT", 5432)),
         database=os.getenv("DB_NAME", "financial_index_db"),
         user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD")
+        password=os.getenv("DB_PASSWORD"),
+        min_connections=int(os.getenv("DB_POOL_MIN", 1)),
+        max_connections=int(os.getenv("DB_POOL_MAX", 4)),
+        pool_timeout_seconds=float(os.getenv("DB_POOL_TIMEOUT", 30))
     )
\ No newline at end of file
@@ -19,9 +19,15 @@ DROP TABLE IF EXISTS bronze.raw_index_constituents_current CASCADE;
 DROP TABLE IF EXISTS bronze.raw_index_constituents_historical CASCADE;
 DROP TABLE IF EXISTS bronze.raw_index_prices_base100 CASCADE;
 DROP TABLE IF EXISTS bronze.raw_stock_valuation_metrics CASCADE;
+DROP TABLE IF EXISTS bronze.load_manifest CASCADE;
+
+-- Raw tables are LIST-partitioned by source_file. A full reload builds a new
+-- partition for the file and swaps it in (DETACH old / ATTACH new), so
+-- replacing a file leaves no dead tuples behind. Rows written before a
+-- file's first swap land in the DEFAULT partition.
 
 CREATE TABLE bronze.raw_index_constituents_current (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     code TEXT,
     exchange TEXT,
     name TEXT,
@@ -31,11 +37,14 @@ CREATE TABLE bronze.raw_index_constituents_current (
     index_code TEXT,
     as_of_date TEXT,
     loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    source_file TEXT
-);
+    source_file TEXT NOT NULL,
+    PRIMARY KEY (id, source_file)
+) PARTITION BY LIST (source_file);
+
+CREATE TABLE bronze.raw_index_constituents_current_default PARTITION OF bronze.raw_index_constituents_current DEFAULT;
 
 CREATE TABLE bronze.raw_index_constituents_historical (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     code TEXT,
     name TEXT,
     start_date TEXT,
@@ -44,21 +53,28 @@ CREATE TABLE bronze.raw_index_constituents_historical (
     is_delisted TEXT,
     index_code TEXT,
     loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    source_file TEXT
-);
+    source_file TEXT NOT NULL,
+    PRIMARY KEY (id, source_file)
+) PARTITION BY LIST (source_file);
+
+CREATE TABLE bronze.raw_index_constituents_historical_default PARTITION OF bronze.raw_index_constituents_historical DEFAULT;
 
 CREATE TABLE bronze.raw_index_prices_base100 (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     date TEXT,
     index_name TEXT,
     close TEXT,
     base_100 TEXT,
-    loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    source_file TEXT
-);
+    -- Compared with the marts' calculated_at to find restated days
+    loaded_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    source_file TEXT NOT NULL,
+    PRIMARY KEY (id, source_file)
+) PARTITION BY LIST (source_file);
+
+CREATE TABLE bronze.raw_index_prices_base100_default PARTITION OF bronze.raw_index_prices_base100 DEFAULT;
 
 CREATE TABLE bronze.raw_stock_valuation_metrics (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     ticker TEXT,
     short_name TEXT,
     long_name TEXT,
@@ -81,7 +97,22 @@ CREATE TABLE bronze.raw_stock_valuation_metrics (
     volume TEXT,
     data_fetched_at TEXT,
     loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    source_file TEXT
+    source_file TEXT NOT NULL,
+    PRIMARY KEY (id, source_file)
+) PARTITION BY LIST (source_file);
+
+CREATE TABLE bronze.raw_stock_valuation_metrics_default PARTITION OF bronze.raw_stock_valuation_metrics DEFAULT;
+
+-- Bookkeeping: fingerprint of each raw file at its last successful load.
+-- Bronze assets skip the load when the file's content hash is unchanged.
+CREATE TABLE bronze.load_manifest (
+    source_file TEXT PRIMARY KEY,
+    target_table TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    size_bytes BIGINT NOT NULL,
+    modified_at TIMESTAMP NOT NULL,
+    row_count INTEGER,
+    loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX idx_bronze_constituents_current_code ON bronze.raw_index_constituents_current(code);
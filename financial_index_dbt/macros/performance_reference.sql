@@ -0,0 +1,74 @@
+{#
+    Reference computation of the key fct_index_performance metrics, for
+    the singular tests under tests/
+
+    Straight from stg_index_prices_daily over the whole history with
+    unbounded windows (no lookback, no carried state), in `price_type`
+    arithmetic, and rounded like the model's final projection.
+#}
+
+{% macro performance_reference(price_type='DOUBLE PRECISION', risk_free_rate=0.04) %}
+
+WITH prices AS (
+    SELECT
+        index_code,
+        price_date,
+        close_price::{{ price_type }} AS close_price,
+        LAG(close_price::{{ price_type }}, 1) OVER w AS price_1d_ago,
+        LAG(close_price::{{ price_type }}, 252) OVER w AS price_1y_ago,
+        LAG(close_price::{{ price_type }}, 756) OVER w AS price_3y_ago,
+        FIRST_VALUE(close_price::{{ price_type }}) OVER (
+            PARTITION BY index_code, EXTRACT(YEAR FROM price_date)
+            ORDER BY price_date
+        ) AS price_ytd_start,
+        MAX(close_price::{{ price_type }}) OVER (w ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS running_max_price
+    FROM {{ ref('stg_index_prices_daily') }}
+    WINDOW w AS (PARTITION BY index_code ORDER BY price_date)
+),
+
+daily AS (
+    SELECT
+        *,
+        CASE WHEN price_1y_ago > 0 THEN (close_price / price_1y_ago) - 1 END AS annual_return,
+        CASE WHEN price_3y_ago > 0 THEN POWER((close_price / price_3y_ago), (1.0 / 3.0)) - 1 END AS return_3y_cagr,
+        CASE WHEN price_ytd_start > 0 THEN (close_price / price_ytd_start) - 1 END AS ytd_return,
+        CASE WHEN price_1d_ago > 0 THEN LN(close_price / price_1d_ago) END AS daily_log_return,
+        CASE
+            WHEN running_max_price > 0
+            THEN (close_price - running_max_price) / running_max_price
+            ELSE 0
+        END AS drawdown_from_ath
+    FROM prices
+),
+
+rolling AS (
+    SELECT
+        *,
+        STDDEV(daily_log_return) OVER (w ROWS BETWEEN 251 PRECEDING AND CURRENT ROW) * SQRT(252::{{ price_type }}) AS volatility_252d,
+        MIN(drawdown_from_ath) OVER (w ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS max_drawdown_all_time,
+        MAX(CASE WHEN close_price = running_max_price THEN price_date END) OVER (w ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS last_ath_date
+    FROM daily
+    WINDOW w AS (PARTITION BY index_code ORDER BY price_date)
+)
+
+SELECT
+    index_code,
+    price_date,
+    ROUND((annual_return * 100)::NUMERIC, 4) AS annual_return_pct,
+    ROUND((ytd_return * 100)::NUMERIC, 4) AS ytd_return_pct,
+    ROUND((return_3y_cagr * 100)::NUMERIC, 2) AS return_3y_annualized_pct,
+    ROUND((volatility_252d * 100)::NUMERIC, 2) AS volatility_252d_pct,
+    ROUND((CASE WHEN volatility_252d > 0 THEN (annual_return - {{ risk_free_rate }}) / volatility_252d END)::NUMERIC, 3) AS sharpe_ratio_1y,
+    ROUND(running_max_price::NUMERIC, 2) AS all_time_high,
+    ROUND((drawdown_from_ath * 100)::NUMERIC, 2) AS current_drawdown_from_ath_pct,
+    ROUND((max_drawdown_all_time * 100)::NUMERIC, 2) AS max_drawdown_all_time_pct,
+    price_date - last_ath_date AS days_since_ath
+FROM rolling
+
+{% endmacro %}
+
+
+{% macro differs_beyond(left, right, tolerance=0) -%}
+    {#- True when exactly one side is NULL or they are more than `tolerance` apart -#}
+    (({{ left }} IS NULL) <> ({{ right }} IS NULL) OR ABS({{ left }} - {{ right }}) > {{ tolerance }})
+{%- endmacro %}
@@ -0,0 +1,65 @@
+{#
+    Rollup of fct_index_performance to one row per index and period
+    ('week' or 'month'), for long-range charts.
+
+    Column names match the daily performance views, so a chart query only
+    swaps the table: price_date is the last trading day of the period and
+    the point-in-time metrics (close, YTD return, volatility, drawdown) are
+    that day's values. The period's deepest and shallowest drawdowns keep
+    the troughs a single end-of-period point would hide.
+#}
+
+{% macro performance_rollup(period) %}
+
+WITH daily AS (
+    SELECT
+        p.*,
+        DATE_TRUNC('{{ period }}', p.price_date)::DATE AS period_start
+    FROM {{ ref('fct_index_performance') }} p
+),
+
+period_stats AS (
+    SELECT
+        index_code,
+        period_start,
+        MAX(price_date) AS period_end_date,
+        COUNT(*) AS trading_days,
+        MIN(current_drawdown_from_ath_pct) AS min_drawdown_from_ath_pct,
+        MAX(current_drawdown_from_ath_pct) AS max_drawdown_from_ath_pct
+    FROM daily
+    GROUP BY index_code, period_start
+)
+
+SELECT
+    ps.period_end_date AS price_date,
+    ps.period_start,
+    ps.index_code,
+    d.index_name,
+    ps.trading_days,
+    
+    -- Last close and return of the period
+    d.close_price,
+    d.ytd_return_pct,
+    d.annual_return_pct,
+    
+    -- End-of-period volatility (only with a full 30-day window, as in
+    -- fct_index_volatility)
+    CASE WHEN d.days_in_30d_window >= 30 THEN d.volatility_30d_pct END AS volatility_30d_pct,
+    CASE WHEN d.days_in_30d_window >= 30 THEN d.volatility_90d_pct END AS volatility_90d_pct,
+    CASE WHEN d.days_in_30d_window >= 30 THEN d.volatility_252d_pct END AS volatility_252d_pct,
+    
+    -- Drawdown: end of period, deepest and shallowest in the period
+    d.current_drawdown_from_ath_pct,
+    ps.min_drawdown_from_ath_pct,
+    ps.max_drawdown_from_ath_pct,
+    d.days_since_ath,
+    
+    -- Audit
+    CURRENT_TIMESTAMP AS calculated_at
+
+FROM period_stats ps
+JOIN daily d
+    ON ps.index_code = d.index_code
+    AND ps.period_end_date = d.price_date
+
+{% endmacro %}
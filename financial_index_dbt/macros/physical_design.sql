@@ -0,0 +1,33 @@
+{#
+    Physical design of the marts
+
+    Index declarations for the `indexes` config of dbt-postgres, which
+    creates them after each build of a table or incremental model, and an
+    ANALYZE post-hook so the planner has fresh statistics for the
+    dashboard's queries as soon as a model is rebuilt.
+#}
+
+{% macro date_series_indexes(series_column='index_code', date_column='price_date', unique=True) -%}
+    {#- btree for per-series lookups and ranges (and the incremental merge),
+        BRIN for date-range scans (incremental runs append days in date
+        order, so the heap stays correlated with the date) -#}
+    {{ return([
+        {'columns': [series_column, date_column], 'type': 'btree', 'unique': unique},
+        {'columns': [date_column], 'type': 'brin'},
+    ]) }}
+{%- endmacro %}
+
+
+{% macro series_indexes(series_column='index_code') -%}
+    {{ return([
+        {'columns': [series_column], 'type': 'btree'},
+    ]) }}
+{%- endmacro %}
+
+
+{% macro analyze_relation() -%}
+    {#- Views have no statistics of their own -#}
+    {%- if model.config.materialized in ('table', 'incremental') -%}
+        ANALYZE {{ this }}
+    {%- endif -%}
+{%- endmacro %}
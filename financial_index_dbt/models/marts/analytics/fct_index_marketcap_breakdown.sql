@@ -31,7 +31,8 @@ TALKING POINTS FOR INTERVIEWS:
 
 {{ config(
     materialized='table',
-    schema='analytics'
+    schema='analytics',
+    indexes=series_indexes()
 ) }}
 
 WITH marketcap_classification AS (
@@ -200,7 +201,4 @@ FROM marketcap_with_cumulative mc
 JOIN {{ ref('dim_indices') }} i 
     ON mc.index_key = i.index_key
 JOIN {{ ref('dim_dates') }} d 
-    ON mc.date_key = d.date_key
-ORDER BY 
-    i.index_name,
-    mc.category_rank
\ No newline at end of file
+    ON mc.date_key = d.date_key
\ No newline at end of file
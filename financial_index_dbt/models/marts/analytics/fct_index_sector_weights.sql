@@ -27,7 +27,8 @@ TALKING POINTS FOR INTERVIEWS:
 
 {{ config(
     materialized='table',
-    schema='analytics'
+    schema='analytics',
+    indexes=series_indexes()
 ) }}
 
 WITH sector_aggregation AS (
@@ -165,7 +166,4 @@ FROM sector_ranked sr
 JOIN {{ ref('dim_indices') }} i 
     ON sr.index_key = i.index_key
 JOIN {{ ref('dim_dates') }} d 
-    ON sr.date_key = d.date_key
-ORDER BY 
-    i.index_name,
-    sr.sector_rank
\ No newline at end of file
+    ON sr.date_key = d.date_key
\ No newline at end of file
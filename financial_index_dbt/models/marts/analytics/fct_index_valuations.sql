@@ -32,7 +32,8 @@ TALKING POINTS FOR INTERVIEWS:
 
 {{ config(
     materialized='table',
-    schema='analytics'
+    schema='analytics',
+    indexes=date_series_indexes(date_column='valuation_date', unique=False)
 ) }}
 
 WITH index_constituents AS (
@@ -198,5 +199,4 @@ FROM valuation_metrics vm
 JOIN {{ ref('dim_indices') }} i 
     ON vm.index_key = i.index_key
 JOIN {{ ref('dim_dates') }} d 
-    ON vm.date_key = d.date_key
-ORDER BY i.index_name, d.calendar_date
\ No newline at end of file
+    ON vm.date_key = d.date_key
\ No newline at end of file
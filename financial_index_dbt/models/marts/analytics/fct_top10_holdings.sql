@@ -26,7 +26,8 @@ TALKING POINTS FOR INTERVIEWS:
 
 {{ config(
     materialized='table',
-    schema='analytics'
+    schema='analytics',
+    indexes=series_indexes()
 ) }}
 
 WITH ranked_holdings AS (
@@ -112,7 +113,4 @@ FROM top10_with_cumulative t10
 JOIN {{ ref('dim_indices') }} i 
     ON t10.index_key = i.index_key
 JOIN {{ ref('dim_dates') }} d 
-    ON t10.date_key = d.date_key
-ORDER BY 
-    i.index_name,
-    t10.holding_rank
\ No newline at end of file
+    ON t10.date_key = d.date_key
\ No newline at end of file
@@ -86,5 +86,4 @@ SELECT
     fiscal_quarter,
     fiscal_year
 FROM date_attributes
-WHERE is_business_day = TRUE
-ORDER BY calendar_date
\ No newline at end of file
+WHERE is_business_day = TRUE
\ No newline at end of file
@@ -55,5 +55,4 @@ SELECT
     CURRENT_TIMESTAMP AS created_at,
     CURRENT_TIMESTAMP AS updated_at
     
-FROM index_metadata
-ORDER BY index_code
\ No newline at end of file
+FROM index_metadata
\ No newline at end of file
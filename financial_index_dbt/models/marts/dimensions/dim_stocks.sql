@@ -83,5 +83,4 @@ SELECT
     CURRENT_TIMESTAMP AS updated_at
 FROM base_tickers t
 LEFT JOIN current_info c ON t.ticker = c.ticker
-LEFT JOIN fund_data f ON t.ticker = f.ticker
-ORDER BY t.ticker
\ No newline at end of file
+LEFT JOIN fund_data f ON t.ticker = f.ticker
\ No newline at end of file
@@ -51,6 +51,4 @@ INNER JOIN {{ ref('dim_stocks') }} s
 INNER JOIN {{ ref('dim_indices') }} i 
     ON c.index_code = i.index_code
 INNER JOIN {{ ref('dim_dates') }} d 
-    ON c.snapshot_date = d.calendar_date
-
-ORDER BY c.index_code, c.ticker, c.snapshot_date
\ No newline at end of file
+    ON c.snapshot_date = d.calendar_date
\ No newline at end of file
@@ -0,0 +1,51 @@
+/*
+================================================================================
+MODEL: fct_index_latest_snapshot
+LAYER: Gold - Performance Mart
+PURPOSE: Latest performance KPIs per index for the dashboard header
+================================================================================
+
+BUSINESS LOGIC:
+- One row per index: its most recent day in fct_index_performance
+- as_of_date is that index's own latest date, so an index whose prices lag
+  behind keeps its row instead of dropping out of the header
+
+USE CASES:
+- Overview KPI cards (1Y/3Y/5Y/YTD returns, volatility, Sharpe, drawdown)
+- Benchmark comparison in the stock screener
+================================================================================
+*/
+
+{{ config(
+    materialized='table',
+    schema='performance',
+    indexes=[{'columns': ['index_code'], 'type': 'btree', 'unique': True}]
+) }}
+
+-- Latest row per index (walks the (index_code, price_date) index backwards)
+SELECT DISTINCT ON (p.index_code)
+    p.index_code,
+    p.index_name,
+    p.price_date AS as_of_date,
+    p.close_price,
+    
+    -- Returns (as percentages)
+    p.annual_return_pct,
+    p.return_3y_annualized_pct,
+    p.return_5y_annualized_pct,
+    p.ytd_return_pct,
+    
+    -- Risk
+    p.volatility_252d_pct,
+    p.sharpe_ratio_1y,
+    
+    -- Drawdown
+    p.current_drawdown_from_ath_pct,
+    p.max_drawdown_all_time_pct,
+    p.days_since_ath,
+    
+    -- Audit
+    CURRENT_TIMESTAMP AS calculated_at
+
+FROM {{ ref('fct_index_performance') }} p
+ORDER BY p.index_code, p.price_date DESC
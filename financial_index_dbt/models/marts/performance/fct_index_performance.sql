@@ -0,0 +1,443 @@
+/*
+================================================================================
+MODEL: fct_index_performance
+LAYER: Gold - Performance Mart
+PURPOSE: Returns, volatility, Sharpe ratio and drawdown in a single pass
+================================================================================
+
+BUSINESS LOGIC:
+- Returns: (price_t / price_t-n) - 1 for 1D to 5Y, YTD, log and annualized
+- Volatility: STDDEV(daily log returns) * SQRT(252) over 21D to 252D windows
+- Sharpe Ratio: (Annualized Return - Risk_Free_Rate) / Volatility
+- Drawdown: (Current_Price - Peak_Price) / Peak_Price from ATH, 1Y and 90D highs
+
+DESIGN:
+- One ordered scan per index: every window shares the definition `w`
+  (index, then date), so prices are sorted once instead of once per model
+- Volatility and drawdown windows run over the first pass's outputs, the
+  only second window level
+- dim_dates and dim_indices are joined once, here
+- fct_index_returns, fct_index_volatility, fct_index_sharpe and
+  fct_index_drawdown are views projecting this table
+
+INCREMENTAL STATE:
+An incremental run reads the new prices plus the last 1260 materialized
+rows per index (the longest LAG, covering every rolling window), and the
+drawdown state of the last row (all-time high, last ATH date, worst
+drawdown). Each of those is a LIMITed probe of the unique (index_code,
+price_date) btree per index, so the cost of a run grows with the number
+of indices and new days, not with the length of the history. Only the
+new days are computed and merged; --full-refresh rebuilds from scratch
+through the same SQL with an empty state.
+
+RESTATEMENTS:
+When a past day's price changes in Bronze (a reloaded daily partition of
+bronze_index_prices_base100), the run recomputes that index from the
+changed day onward: the running drawdown state and every rolling window
+after it depend on that price. The lookback and state are then read
+before the changed day instead of before the next new one.
+tests/assert_fct_index_performance_matches_full_rebuild.sql checks the
+result against a full-history recomputation.
+
+PRECISION:
+Prices are cast to DOUBLE PRECISION on the way in, so LN, POWER, STDDEV
+and the divisions run on hardware floats; outputs are cast back to
+NUMERIC and rounded only in the final projection. The state_* columns
+stay DOUBLE PRECISION.
+================================================================================
+*/
+
+{{ config(
+    materialized='incremental',
+    incremental_strategy='merge',
+    unique_key=['index_code', 'price_date'],
+    indexes=date_series_indexes(),
+    schema='performance'
+) }}
+
+-- Longest LAG below (5 years of trading days)
+{% set lookback_rows = 1260 %}
+-- Risk-free rate for Sharpe ratios (4% annual)
+{% set risk_free_rate = 0.04 %}
+
+WITH RECURSIVE
+
+{% if is_incremental() %}
+
+series AS (
+    -- Indices already materialized: a loose index scan, one probe of the
+    -- unique (index_code, price_date) btree per index
+    SELECT MIN(index_code) AS index_code
+    FROM {{ this }}
+    UNION ALL
+    SELECT (
+        SELECT MIN(t.index_code)
+        FROM {{ this }} t
+        WHERE t.index_code > s.index_code
+    )
+    FROM series s
+    WHERE s.index_code IS NOT NULL
+),
+
+last_rows AS (
+    -- Last materialized row per index (a backward btree probe each)
+    SELECT last_row.*
+    FROM series s
+    CROSS JOIN LATERAL (
+        SELECT
+            t.index_code,
+            t.price_date AS last_date,
+            t.calculated_at AS last_calculated_at
+        FROM {{ this }} t
+        WHERE t.index_code = s.index_code
+        ORDER BY t.price_date DESC
+        LIMIT 1
+    ) last_row
+),
+
+restatements AS (
+    -- Earliest materialized day whose price changed in a Bronze reload
+    -- since the index was last built (e.g., a backfilled price partition).
+    -- Only prices loaded after that build are compared, each through a
+    -- btree lookup. loaded_at and calculated_at are both timestamptz
+    -- stamped by the database, so worker clocks and time zones don't matter
+    SELECT p.index_code, MIN(p.price_date) AS restate_from
+    FROM {{ ref('stg_index_prices_daily') }} p
+    JOIN last_rows l
+        ON p.index_code = l.index_code
+    LEFT JOIN {{ this }} t
+        ON p.index_code = t.index_code
+        AND p.price_date = t.price_date
+    WHERE p.price_date <= l.last_date
+      AND p.loaded_at > l.last_calculated_at
+      AND p.close_price IS DISTINCT FROM t.close_price
+    GROUP BY p.index_code
+),
+
+cutoffs AS (
+    -- First day to (re)compute per index: the earliest restated day, or
+    -- the day after the last materialized one
+    SELECT
+        l.index_code,
+        COALESCE(r.restate_from, l.last_date + 1) AS compute_from
+    FROM last_rows l
+    LEFT JOIN restatements r
+        ON l.index_code = r.index_code
+),
+
+state AS (
+    -- Drawdown state of the last materialized row before the cutoff
+    SELECT prev.*
+    FROM cutoffs c
+    CROSS JOIN LATERAL (
+        SELECT
+            t.index_code,
+            t.state_running_max_price,
+            t.state_last_ath_date,
+            t.state_max_drawdown_all_time
+        FROM {{ this }} t
+        WHERE t.index_code = c.index_code
+        AND t.price_date < c.compute_from
+        ORDER BY t.price_date DESC
+        LIMIT 1
+    ) prev
+),
+
+lookback AS (
+    -- Already materialized rows feeding the windows of the days computed
+    -- (the last {{ lookback_rows }} per index before the cutoff, read
+    -- backwards off the btree)
+    SELECT lb.price_date, c.index_code, lb.close_price::DOUBLE PRECISION AS close_price, lb.state_drawdown_from_ath AS drawdown_from_ath, FALSE AS is_new
+    FROM cutoffs c
+    CROSS JOIN LATERAL (
+        SELECT t.price_date, t.close_price, t.state_drawdown_from_ath
+        FROM {{ this }} t
+        WHERE t.index_code = c.index_code
+        AND t.price_date < c.compute_from
+        ORDER BY t.price_date DESC
+        LIMIT {{ lookback_rows }}
+    ) lb
+),
+
+prices_in_scope AS (
+    SELECT * FROM lookback
+    UNION ALL
+    SELECT p.price_date, p.index_code, p.close_price::DOUBLE PRECISION AS close_price, NULL::DOUBLE PRECISION AS drawdown_from_ath, TRUE AS is_new
+    FROM {{ ref('stg_index_prices_daily') }} p
+    LEFT JOIN cutoffs c
+        ON p.index_code = c.index_code
+    WHERE c.compute_from IS NULL OR p.price_date >= c.compute_from
+),
+
+{% else %}
+
+state AS (
+    SELECT
+        NULL::TEXT AS index_code,
+        NULL::DOUBLE PRECISION AS state_running_max_price,
+        NULL::DATE AS state_last_ath_date,
+        NULL::DOUBLE PRECISION AS state_max_drawdown_all_time
+    WHERE FALSE
+),
+
+prices_in_scope AS (
+    SELECT price_date, index_code, close_price::DOUBLE PRECISION AS close_price, NULL::DOUBLE PRECISION AS drawdown_from_ath, TRUE AS is_new
+    FROM {{ ref('stg_index_prices_daily') }}
+),
+
+{% endif %}
+
+price_windows AS (
+    -- First pass: lagged prices and peaks
+    SELECT
+        pis.price_date,
+        pis.index_code,
+        pis.close_price,
+        pis.drawdown_from_ath,
+        pis.is_new,
+        s.state_last_ath_date,
+        s.state_max_drawdown_all_time,
+        
+        -- Previous periods' prices
+        LAG(pis.close_price, 1) OVER w AS price_1d_ago,
+        LAG(pis.close_price, 5) OVER w AS price_1w_ago,
+        LAG(pis.close_price, 21) OVER w AS price_1m_ago,
+        LAG(pis.close_price, 63) OVER w AS price_3m_ago,
+        LAG(pis.close_price, 252) OVER w AS price_1y_ago,
+        LAG(pis.close_price, 756) OVER w AS price_3y_ago,
+        LAG(pis.close_price, 1260) OVER w AS price_5y_ago,
+        
+        -- Price at start of year (`w` is ordered by year first, so this
+        -- reuses its sort)
+        FIRST_VALUE(pis.close_price) OVER (
+            PARTITION BY pis.index_code, EXTRACT(YEAR FROM pis.price_date)
+            ORDER BY pis.price_date
+            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+        ) AS price_ytd_start,
+        
+        -- Running maximum price (all-time high), carried forward from the
+        -- state. Only meaningful on new rows.
+        GREATEST(
+            s.state_running_max_price,
+            MAX(pis.close_price) OVER (w ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+        ) AS running_max_price,
+        
+        -- Rolling 252-day and 90-day maximum
+        MAX(pis.close_price) OVER (w ROWS BETWEEN 251 PRECEDING AND CURRENT ROW) AS rolling_max_price_252d,
+        MAX(pis.close_price) OVER (w ROWS BETWEEN 89 PRECEDING AND CURRENT ROW) AS rolling_max_price_90d
+    
+    FROM prices_in_scope pis
+    LEFT JOIN state s
+        ON pis.index_code = s.index_code
+    WINDOW w AS (
+        PARTITION BY pis.index_code
+        ORDER BY EXTRACT(YEAR FROM pis.price_date), pis.price_date
+    )
+),
+
+daily_metrics AS (
+    -- Returns and drawdowns of each day (no windows)
+    SELECT
+        pw.*,
+        
+        -- ==============================================================
+        -- SIMPLE RETURNS
+        -- ==============================================================
+        
+        CASE WHEN pw.price_1d_ago > 0 THEN (pw.close_price / pw.price_1d_ago) - 1 END AS daily_return,
+        CASE WHEN pw.price_1w_ago > 0 THEN (pw.close_price / pw.price_1w_ago) - 1 END AS weekly_return,
+        CASE WHEN pw.price_1m_ago > 0 THEN (pw.close_price / pw.price_1m_ago) - 1 END AS monthly_return,
+        CASE WHEN pw.price_3m_ago > 0 THEN (pw.close_price / pw.price_3m_ago) - 1 END AS quarterly_return,
+        CASE WHEN pw.price_1y_ago > 0 THEN (pw.close_price / pw.price_1y_ago) - 1 END AS annual_return,
+        CASE WHEN pw.price_3y_ago > 0 THEN (pw.close_price / pw.price_3y_ago) - 1 END AS return_3y,
+        CASE WHEN pw.price_5y_ago > 0 THEN (pw.close_price / pw.price_5y_ago) - 1 END AS return_5y,
+        CASE WHEN pw.price_ytd_start > 0 THEN (pw.close_price / pw.price_ytd_start) - 1 END AS ytd_return,
+        
+        -- Daily Log Return
+        CASE WHEN pw.price_1d_ago > 0 THEN LN(pw.close_price / pw.price_1d_ago) END AS daily_log_return,
+        
+        -- ==============================================================
+        -- ANNUALIZED RETURNS
+        -- ==============================================================
+        
+        CASE WHEN pw.price_1m_ago > 0 THEN POWER((pw.close_price / pw.price_1m_ago), (252.0 / 21.0)) - 1 END AS monthly_return_annualized,
+        CASE WHEN pw.price_3m_ago > 0 THEN POWER((pw.close_price / pw.price_3m_ago), (252.0 / 63.0)) - 1 END AS quarterly_return_annualized,
+        CASE WHEN pw.price_3y_ago > 0 THEN POWER((pw.close_price / pw.price_3y_ago), (1.0 / 3.0)) - 1 END AS return_3y_cagr,
+        CASE WHEN pw.price_5y_ago > 0 THEN POWER((pw.close_price / pw.price_5y_ago), (1.0 / 5.0)) - 1 END AS return_5y_cagr,
+        
+        -- ==============================================================
+        -- DRAWDOWNS
+        -- ==============================================================
+        
+        -- From All-Time High (lookback rows keep their own)
+        CASE
+            WHEN NOT pw.is_new THEN pw.drawdown_from_ath
+            WHEN pw.running_max_price > 0
+            THEN (pw.close_price - pw.running_max_price) / pw.running_max_price
+            ELSE 0
+        END AS current_drawdown_from_ath,
+        
+        CASE
+            WHEN pw.rolling_max_price_252d > 0
+            THEN (pw.close_price - pw.rolling_max_price_252d) / pw.rolling_max_price_252d
+            ELSE 0
+        END AS current_drawdown_252d,
+        
+        CASE
+            WHEN pw.rolling_max_price_90d > 0
+            THEN (pw.close_price - pw.rolling_max_price_90d) / pw.rolling_max_price_90d
+            ELSE 0
+        END AS current_drawdown_90d,
+        
+        -- Peak flags
+        (pw.is_new AND pw.close_price = pw.running_max_price) AS is_new_ath,
+        (pw.close_price = pw.rolling_max_price_252d) AS is_new_252d_high
+    
+    FROM price_windows pw
+),
+
+rolling_metrics AS (
+    -- Second pass: rolling volatility and drawdown aggregates
+    SELECT
+        dm.*,
+        
+        -- ==============================================================
+        -- ROLLING VOLATILITY (annualized; STDDEV skips the first day's NULL)
+        -- ==============================================================
+        
+        (STDDEV(dm.daily_log_return) OVER (w ROWS BETWEEN 20 PRECEDING AND CURRENT ROW) * SQRT(252)) AS realized_volatility_21d,
+        (STDDEV(dm.daily_log_return) OVER (w ROWS BETWEEN 29 PRECEDING AND CURRENT ROW) * SQRT(252)) AS volatility_30d,
+        (STDDEV(dm.daily_log_return) OVER (w ROWS BETWEEN 89 PRECEDING AND CURRENT ROW) * SQRT(252)) AS volatility_90d,
+        (STDDEV(dm.daily_log_return) OVER (w ROWS BETWEEN 179 PRECEDING AND CURRENT ROW) * SQRT(252)) AS volatility_180d,
+        (STDDEV(dm.daily_log_return) OVER (w ROWS BETWEEN 251 PRECEDING AND CURRENT ROW) * SQRT(252)) AS volatility_252d,
+        
+        -- Returns in window (for data quality)
+        COUNT(dm.daily_log_return) OVER (w ROWS BETWEEN 29 PRECEDING AND CURRENT ROW) AS days_in_30d_window,
+        COUNT(dm.daily_log_return) OVER (w ROWS BETWEEN 251 PRECEDING AND CURRENT ROW) AS days_in_252d_window,
+        
+        -- ==============================================================
+        -- ROLLING MAXIMUM DRAWDOWN
+        -- ==============================================================
+        
+        MIN(dm.current_drawdown_from_ath) OVER (w ROWS BETWEEN 251 PRECEDING AND CURRENT ROW) AS max_drawdown_252d,
+        MIN(dm.current_drawdown_from_ath) OVER (w ROWS BETWEEN 89 PRECEDING AND CURRENT ROW) AS max_drawdown_90d,
+        
+        -- All-time maximum drawdown, carried forward from the state
+        LEAST(
+            dm.state_max_drawdown_all_time,
+            MIN(CASE WHEN dm.is_new THEN dm.current_drawdown_from_ath END) OVER (w ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+        ) AS max_drawdown_all_time,
+        
+        -- Date of the last all-time high (falls back to the carried state)
+        COALESCE(
+            MAX(CASE WHEN dm.is_new_ath THEN dm.price_date END) OVER (w ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW),
+            dm.state_last_ath_date
+        ) AS last_ath_date
+    
+    FROM daily_metrics dm
+    WINDOW w AS (
+        PARTITION BY dm.index_code
+        ORDER BY EXTRACT(YEAR FROM dm.price_date), dm.price_date
+    )
+),
+
+sharpe_calculated AS (
+    -- Sharpe ratios and excess returns (no windows)
+    SELECT
+        rm.*,
+        CASE WHEN rm.volatility_252d > 0 THEN (rm.annual_return - {{ risk_free_rate }}) / rm.volatility_252d END AS sharpe_ratio_1y,
+        -- 6-month Sharpe uses the quarterly annualized return with 180-day volatility
+        CASE WHEN rm.volatility_180d > 0 THEN (rm.quarterly_return_annualized - {{ risk_free_rate }}) / rm.volatility_180d END AS sharpe_ratio_6m,
+        CASE WHEN rm.volatility_90d > 0 THEN (rm.quarterly_return_annualized - {{ risk_free_rate }}) / rm.volatility_90d END AS sharpe_ratio_3m,
+        CASE WHEN rm.volatility_30d > 0 THEN (rm.monthly_return_annualized - {{ risk_free_rate }}) / rm.volatility_30d END AS sharpe_ratio_1m,
+        rm.annual_return - {{ risk_free_rate }} AS excess_return_1y,
+        rm.monthly_return_annualized - {{ risk_free_rate }} AS excess_return_1m_annualized
+    FROM rolling_metrics rm
+)
+
+-- Final output
+SELECT
+    sc.price_date,
+    d.date_key,
+    sc.index_code,
+    i.index_name,
+    ROUND(sc.close_price::NUMERIC, 2) AS close_price,
+    
+    -- Simple Returns (as percentages)
+    ROUND((sc.daily_return * 100)::NUMERIC, 4) AS daily_return_pct,
+    ROUND((sc.weekly_return * 100)::NUMERIC, 4) AS weekly_return_pct,
+    ROUND((sc.monthly_return * 100)::NUMERIC, 4) AS monthly_return_pct,
+    ROUND((sc.quarterly_return * 100)::NUMERIC, 4) AS quarterly_return_pct,
+    ROUND((sc.annual_return * 100)::NUMERIC, 4) AS annual_return_pct,
+    ROUND((sc.return_3y * 100)::NUMERIC, 4) AS return_3y_pct,
+    ROUND((sc.return_5y * 100)::NUMERIC, 4) AS return_5y_pct,
+    ROUND((sc.ytd_return * 100)::NUMERIC, 4) AS ytd_return_pct,
+    
+    -- Log Returns (for statistical use)
+    ROUND(sc.daily_log_return::NUMERIC, 6) AS daily_log_return,
+    
+    -- Annualized Returns (as percentages)
+    ROUND((sc.monthly_return_annualized * 100)::NUMERIC, 2) AS monthly_return_annualized_pct,
+    ROUND((sc.quarterly_return_annualized * 100)::NUMERIC, 2) AS quarterly_return_annualized_pct,
+    ROUND((sc.return_3y_cagr * 100)::NUMERIC, 2) AS return_3y_annualized_pct,
+    ROUND((sc.return_5y_cagr * 100)::NUMERIC, 2) AS return_5y_annualized_pct,
+    
+    -- Volatility (as percentages)
+    ROUND((sc.volatility_30d * 100)::NUMERIC, 2) AS volatility_30d_pct,
+    ROUND((sc.volatility_90d * 100)::NUMERIC, 2) AS volatility_90d_pct,
+    ROUND((sc.volatility_180d * 100)::NUMERIC, 2) AS volatility_180d_pct,
+    ROUND((sc.volatility_252d * 100)::NUMERIC, 2) AS volatility_252d_pct,
+    ROUND((sc.realized_volatility_21d * 100)::NUMERIC, 2) AS realized_volatility_21d_pct,
+    sc.days_in_30d_window,
+    sc.days_in_252d_window,
+    
+    -- Sharpe Ratios
+    ROUND({{ risk_free_rate }} * 100, 2) AS risk_free_rate_pct,
+    ROUND(sc.sharpe_ratio_1y::NUMERIC, 3) AS sharpe_ratio_1y,
+    ROUND(sc.sharpe_ratio_6m::NUMERIC, 3) AS sharpe_ratio_6m,
+    ROUND(sc.sharpe_ratio_3m::NUMERIC, 3) AS sharpe_ratio_3m,
+    ROUND(sc.sharpe_ratio_1m::NUMERIC, 3) AS sharpe_ratio_1m,
+    ROUND((sc.excess_return_1y * 100)::NUMERIC, 2) AS excess_return_1y_pct,
+    ROUND((sc.excess_return_1m_annualized * 100)::NUMERIC, 2) AS excess_return_1m_annualized_pct,
+    
+    -- Peak Prices
+    ROUND(sc.running_max_price::NUMERIC, 2) AS all_time_high,
+    ROUND(sc.rolling_max_price_252d::NUMERIC, 2) AS high_252d,
+    ROUND(sc.rolling_max_price_90d::NUMERIC, 2) AS high_90d,
+    
+    -- Drawdowns (as percentages)
+    ROUND((sc.current_drawdown_from_ath * 100)::NUMERIC, 2) AS current_drawdown_from_ath_pct,
+    ROUND((sc.current_drawdown_252d * 100)::NUMERIC, 2) AS current_drawdown_252d_pct,
+    ROUND((sc.current_drawdown_90d * 100)::NUMERIC, 2) AS current_drawdown_90d_pct,
+    ROUND((sc.max_drawdown_all_time * 100)::NUMERIC, 2) AS max_drawdown_all_time_pct,
+    ROUND((sc.max_drawdown_252d * 100)::NUMERIC, 2) AS max_drawdown_252d_pct,
+    ROUND((sc.max_drawdown_90d * 100)::NUMERIC, 2) AS max_drawdown_90d_pct,
+    
+    -- Peak Flags and Recovery
+    sc.is_new_ath,
+    sc.is_new_252d_high,
+    sc.price_date - sc.last_ath_date AS days_since_ath,
+    ROUND((sc.close_price - sc.running_max_price)::NUMERIC, 2) AS distance_from_ath,
+    
+    -- Metadata
+    EXTRACT(YEAR FROM sc.price_date) AS year,
+    EXTRACT(QUARTER FROM sc.price_date) AS quarter,
+    EXTRACT(MONTH FROM sc.price_date) AS month,
+    EXTRACT(DOW FROM sc.price_date) AS day_of_week,
+    
+    -- Carried state for incremental runs (unrounded)
+    sc.running_max_price AS state_running_max_price,
+    sc.last_ath_date AS state_last_ath_date,
+    sc.current_drawdown_from_ath AS state_drawdown_from_ath,
+    sc.max_drawdown_all_time AS state_max_drawdown_all_time,
+    
+    -- Audit
+    CURRENT_TIMESTAMP AS calculated_at
+
+FROM sharpe_calculated sc
+LEFT JOIN {{ ref('dim_dates') }} d
+    ON sc.price_date = d.calendar_date
+LEFT JOIN {{ ref('dim_indices') }} i
+    ON sc.index_code = i.index_code
+-- Lookback rows only feed the windows; they are already materialized
+WHERE sc.is_new
@@ -0,0 +1,15 @@
+/*
+================================================================================
+MODEL: fct_index_performance_monthly
+LAYER: Gold - Performance Mart
+PURPOSE: Monthly rollup of fct_index_performance for long-range charts
+================================================================================
+*/
+
+{{ config(
+    materialized='table',
+    schema='performance',
+    indexes=date_series_indexes()
+) }}
+
+{{ performance_rollup('month') }}
@@ -0,0 +1,34 @@
+{{ config(tags=['equivalence']) }}
+
+/*
+    fct_index_performance is built incrementally from a 1260-row lookback
+    and carried drawdown state. Every row must equal a from-scratch
+    recomputation over the whole history in the same double-precision
+    arithmetic. Returns the days that differ, or that only one side has.
+    
+    Tagged 'equivalence': the recomputation scans the whole history, so the
+    test runs in the weekly dbt_equivalence job, not in each eager build.
+*/
+
+WITH reference AS (
+    {{ performance_reference('DOUBLE PRECISION') }}
+)
+
+SELECT
+    COALESCE(p.index_code, r.index_code) AS index_code,
+    COALESCE(p.price_date, r.price_date) AS price_date
+FROM {{ ref('fct_index_performance') }} p
+FULL OUTER JOIN reference r
+    ON p.index_code = r.index_code
+    AND p.price_date = r.price_date
+WHERE p.index_code IS NULL
+   OR r.index_code IS NULL
+   OR {{ differs_beyond('p.annual_return_pct', 'r.annual_return_pct') }}
+   OR {{ differs_beyond('p.ytd_return_pct', 'r.ytd_return_pct') }}
+   OR {{ differs_beyond('p.return_3y_annualized_pct', 'r.return_3y_annualized_pct') }}
+   OR {{ differs_beyond('p.volatility_252d_pct', 'r.volatility_252d_pct') }}
+   OR {{ differs_beyond('p.sharpe_ratio_1y', 'r.sharpe_ratio_1y') }}
+   OR {{ differs_beyond('p.all_time_high', 'r.all_time_high') }}
+   OR {{ differs_beyond('p.current_drawdown_from_ath_pct', 'r.current_drawdown_from_ath_pct') }}
+   OR {{ differs_beyond('p.max_drawdown_all_time_pct', 'r.max_drawdown_all_time_pct') }}
+   OR p.days_since_ath IS DISTINCT FROM r.days_since_ath
@@ -0,0 +1,32 @@
+{{ config(tags=['equivalence']) }}
+
+/*
+    fct_index_performance computes in double precision. Its rounded
+    outputs must stay within one unit of their last decimal of the same
+    metrics computed in NUMERIC, as the performance models did before.
+    Returns the days that drift further.
+    
+    Tagged 'equivalence' (whole-history recomputation): runs in the weekly
+    dbt_equivalence job, not in each eager build.
+*/
+
+WITH reference AS (
+    {{ performance_reference('NUMERIC') }}
+)
+
+SELECT
+    p.index_code,
+    p.price_date
+FROM {{ ref('fct_index_performance') }} p
+JOIN reference r
+    ON p.index_code = r.index_code
+    AND p.price_date = r.price_date
+WHERE {{ differs_beyond('p.annual_return_pct', 'r.annual_return_pct', 0.0001) }}
+   OR {{ differs_beyond('p.ytd_return_pct', 'r.ytd_return_pct', 0.0001) }}
+   OR {{ differs_beyond('p.return_3y_annualized_pct', 'r.return_3y_annualized_pct', 0.01) }}
+   OR {{ differs_beyond('p.volatility_252d_pct', 'r.volatility_252d_pct', 0.01) }}
+   OR {{ differs_beyond('p.sharpe_ratio_1y', 'r.sharpe_ratio_1y', 0.001) }}
+   OR {{ differs_beyond('p.all_time_high', 'r.all_time_high', 0.01) }}
+   OR {{ differs_beyond('p.current_drawdown_from_ath_pct', 'r.current_drawdown_from_ath_pct', 0.01) }}
+   OR {{ differs_beyond('p.max_drawdown_all_time_pct', 'r.max_drawdown_all_time_pct', 0.01) }}
+   OR p.days_since_ath IS DISTINCT FROM r.days_since_ath
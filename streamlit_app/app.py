@@ -17,8 +17,8 @@ if not os.getenv('DB_PASSWORD'):
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-from config import INDEX_COLORS, CHART_COLORS, DASHBOARD_TITLE, DASHBOARD_SUBTITLE, INDICES
+from datetime import datetime
+from config import INDEX_COLORS, CHART_COLORS, DASHBOARD_TITLE, DASHBOARD_SUBTITLE, INDICES, PERFORMANCE_PERIODS
 from utils import (
     get_latest_metrics,
     get_index_performance,
@@ -27,6 +27,9 @@ from utils import (
     get_all_stocks,
     get_volatility_chart_data,
     get_drawdown_chart_data,
+    get_pool_stats,
+    get_query_stats,
+    prefetch_dashboard,
     create_performance_chart,
     create_sector_pie_chart,
     create_sector_bar_chart,
@@ -128,22 +131,13 @@ with st.sidebar:
     
     # Date range for performance chart
     st.markdown("### 📅 Date Range")
-    date_range = st.selectbox(
+    period = st.selectbox(
         "Performance Period:",
-        options=['1 Year', '3 Years', '5 Years', '10 Years', 'All Time'],
-        index=4
+        options=list(PERFORMANCE_PERIODS),
+        format_func=lambda key: PERFORMANCE_PERIODS[key][0],
+        index=len(PERFORMANCE_PERIODS) - 1
     )
     
-    # Calculate start date
-    date_mapping = {
-        '1 Year': datetime.now() - timedelta(days=365),
-        '3 Years': datetime.now() - timedelta(days=365*3),
-        '5 Years': datetime.now() - timedelta(days=365*5),
-        '10 Years': datetime.now() - timedelta(days=365*10),
-        'All Time': None
-    }
-    start_date = date_mapping[date_range]
-    
     st.markdown("---")
     
     # Refresh button
@@ -160,6 +154,11 @@ with st.sidebar:
     
     Built with Streamlit, Plotly, and dbt
     """)
+    
+    # Shared database connection pool
+    with st.expander("🔌 Connection Pool"):
+        st.json(get_pool_stats())
+        st.dataframe(get_query_stats())
 
 # ==================== MAIN DASHBOARD ====================
 
@@ -168,27 +167,20 @@ st.title(DASHBOARD_TITLE)
 st.markdown(f"**{DASHBOARD_SUBTITLE}**")
 st.markdown("---")
 
-# Load latest metrics
+# Load every dataset of the page concurrently, then the latest metrics
 with st.spinner("Loading data..."):
+    prefetch_dashboard()
     if index_selection == 'Both':
         metrics_df = get_latest_metrics()
     elif index_selection == 'S&P 500':
-        metrics_df = get_latest_metrics('GSPC.INDX')
+        metrics_df = get_latest_metrics('SP500')
     else:
-        metrics_df = get_latest_metrics('OEX.INDX')
-
-# ==================== TAB LAYOUT ====================
-
-tab1, tab2, tab3, tab4 = st.tabs([
-    "📈 Overview", 
-    "🔍 Stock Screener", 
-    "🎯 Sector Analysis", 
-    "⚠️ Risk Metrics"
-])
+        metrics_df = get_latest_metrics('SP100')
 
 # ==================== TAB 1: OVERVIEW ====================
 
-with tab1:
+def render_overview(metrics_df, index_selection, period):
+    """KPIs, cumulative performance chart and detailed metrics of the selected indices"""
     if not metrics_df.empty:
         # KPI Cards
         st.markdown("### 📊 Key Performance Indicators")
@@ -247,14 +239,14 @@ with tab1:
         st.markdown("### 📈 Cumulative Performance")
         
         if index_selection == 'Both':
-            df_sp500 = get_index_performance('SP500', start_date)
-            df_sp100 = get_index_performance('SP100', start_date)
+            df_sp500 = get_index_performance('SP500', period)
+            df_sp100 = get_index_performance('SP100', period)
             fig = create_performance_chart(df_sp500, df_sp100)
         elif index_selection == 'S&P 500':
-            df_sp500 = get_index_performance('SP500', start_date)
+            df_sp500 = get_index_performance('SP500', period)
             fig = create_performance_chart(df_sp500)
         else:
-            df_sp100 = get_index_performance('SP100', start_date)
+            df_sp100 = get_index_performance('SP100', period)
             fig = create_performance_chart(df_sp100)
         
         st.plotly_chart(fig, use_container_width=True)
@@ -282,7 +274,9 @@ with tab1:
 # ==================== TAB 2: STOCK SCREENER ====================
 # ==================== TAB 2: STOCK SCREENER ====================
 
-with tab2:
+@st.fragment
+def render_stock_screener():
+    """Screener filters and results (its widgets rerun only this fragment)"""
     st.markdown("### 🔍 Stock Screener")
     st.markdown("Filter stocks based on fundamental metrics")
     
@@ -408,7 +402,7 @@ with tab2:
             st.markdown("### 📊 Portfolio vs S&P 500 Benchmark")
             
             # Get S&P 500 metrics
-            sp500_metrics = get_latest_metrics('GSPC.INDX')
+            sp500_metrics = get_latest_metrics('SP500')
             
             if not sp500_metrics.empty:
                 comparison_data = {
@@ -549,7 +543,9 @@ with tab2:
 
 # ==================== TAB 3: SECTOR ANALYSIS ====================
 
-with tab3:
+@st.fragment
+def render_sector_analysis(index_selection):
+    """Sector weights and top holdings (its index radio reruns only this fragment)"""
     st.markdown("### 🎯 Sector Analysis")
     
     # Sector selection for analysis
@@ -640,7 +636,9 @@ with tab3:
 
 # ==================== TAB 4: RISK METRICS ====================
 
-with tab4:
+@st.fragment
+def render_risk_metrics(index_selection):
+    """Volatility and drawdown charts and risk statistics (its index radio reruns only this fragment)"""
     st.markdown("### ⚠️ Risk Metrics")
     
     # Risk index selection
@@ -730,6 +728,31 @@ with tab4:
     else:
         st.error("Unable to load risk data. Please check database connection.")
 
+# ==================== TAB LAYOUT ====================
+
+tab1, tab2, tab3, tab4 = st.tabs([
+    "📈 Overview", 
+    "🔍 Stock Screener", 
+    "🎯 Sector Analysis", 
+    "⚠️ Risk Metrics"
+])
+
+# Sidebar widgets rerun the whole script; widgets inside a fragment rerun
+# only that fragment, so e.g. a screener slider doesn't rebuild the
+# Overview, Sector and Risk charts
+
+with tab1:
+    render_overview(metrics_df, index_selection, period)
+
+with tab2:
+    render_stock_screener()
+
+with tab3:
+    render_sector_analysis(index_selection)
+
+with tab4:
+    render_risk_metrics(index_selection)
+
 # ==================== FOOTER ====================
 
 st.markdown("---")
@@ -39,12 +39,51 @@ DB_CONFIG = {
     'port': int(os.getenv('DB_PORT', 5432))
 }
 
+# Connection pool shared by all dashboard sessions (read from .env; the
+# Dagster resource sizes its own pool from DB_POOL_MIN/DB_POOL_MAX)
+DB_POOL_CONFIG = {
+    'min_connections': int(os.getenv('DASHBOARD_DB_POOL_MIN', 1)),
+    'max_connections': int(os.getenv('DASHBOARD_DB_POOL_MAX', 10)),
+    'checkout_timeout': float(os.getenv('DASHBOARD_DB_POOL_TIMEOUT', 30))
+}
+
 # Available indices
 INDICES = {
     'GSPC.INDX': 'S&P 500',
     'OEX.INDX': 'S&P 100'
 }
 
+# Indices of the performance marts (codes named after the price files), in
+# dashboard order. The analytics marts use the INDICES codes above
+PERFORMANCE_INDICES = {
+    'SP500': 'S&P 500',
+    'SP100': 'S&P 100'
+}
+PERFORMANCE_INDEX_CODES = tuple(PERFORMANCE_INDICES)
+
 # Dashboard settings
 DASHBOARD_TITLE = "📊 Index Analytics Dashboard"
-DASHBOARD_SUBTITLE = "S&P 500 vs S&P 100 Performance Analysis"
\ No newline at end of file
+DASHBOARD_SUBTITLE = "S&P 500 vs S&P 100 Performance Analysis"
+
+# Chart resolutions, coarsest first: (rollup suffix, calendar days per point)
+CHART_RESOLUTIONS = [
+    ('monthly', 30.4),
+    ('weekly', 7),
+    ('daily', 365 / 252)
+]
+
+# Fewest points a chart should get before falling back to a finer resolution
+# (All Time and 10Y are monthly, 3Y and 5Y weekly, 1Y daily)
+MIN_CHART_POINTS = 120
+
+# First date of the price history ("All Time" charts)
+HISTORY_START_DATE = '2014-12-31'
+
+# Performance chart periods: key -> (label, years back from the latest date)
+PERFORMANCE_PERIODS = {
+    '1Y': ('1 Year', 1),
+    '3Y': ('3 Years', 3),
+    '5Y': ('5 Years', 5),
+    '10Y': ('10 Years', 10),
+    'ALL': ('All Time', None)
+}
\ No newline at end of file
@@ -0,0 +1,149 @@
+# db_pool.py
+"""
+Thread-safe PostgreSQL connection pool for the dashboard
+Shared by every session and script thread of the Streamlit server
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+import psycopg2
+
+
+class PoolTimeout(Exception):
+    """No pooled connection became free within the checkout timeout"""
+
+
+class DatabasePool:
+    """
+    Pool of autocommit connections (the dashboard only reads, so no session
+    is ever left idle in an aborted transaction).
+    
+    Checkout blocks while all `max_connections` are in use, up to
+    `checkout_timeout` seconds. Returned connections stay open (the most
+    recently used is handed out first), so per-connection state such as
+    prepared statements survives between queries. A connection idle for
+    longer than `health_check_seconds` is pinged before it is handed out;
+    a dead one is discarded and replaced, as is any connection whose query
+    failed at the connection level.
+    """
+    
+    def __init__(self, min_connections, max_connections, checkout_timeout=30.0,
+                 health_check_seconds=30.0, **connect_kwargs):
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.checkout_timeout = checkout_timeout
+        self.health_check_seconds = health_check_seconds
+        self._connect_kwargs = connect_kwargs
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._last_used = {}
+        self._prepared = {}
+        self._stats = {
+            'checkouts': 0,
+            'in_use': 0,
+            'opened': 0,
+            'reconnects': 0,
+            'discarded': 0,
+            'timeouts': 0,
+            'wait_seconds_total': 0.0,
+            'wait_seconds_max': 0.0,
+        }
+        for _ in range(min_connections):
+            self._idle.append(self._connect())
+    
+    def _count(self, key, value=1):
+        with self._lock:
+            self._stats[key] += value
+    
+    def _connect(self):
+        conn = psycopg2.connect(**self._connect_kwargs)
+        conn.autocommit = True
+        self._count('opened')
+        return conn
+    
+    def _discard(self, conn):
+        with self._lock:
+            self._last_used.pop(conn, None)
+            self._prepared.pop(conn, None)
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+    
+    def _is_alive(self, conn):
+        if conn.closed:
+            return False
+        if time.monotonic() - self._last_used.get(conn, 0) < self.health_check_seconds:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
+    
+    def _checkout(self):
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is not None and not self._is_alive(conn):
+            self._discard(conn)
+            self._count('reconnects')
+            conn = None
+        return conn if conn is not None else self._connect()
+    
+    @contextmanager
+    def connection(self):
+        """Borrow a healthy connection for the duration of the block"""
+        start = time.monotonic()
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            self._count('timeouts')
+            raise PoolTimeout(f"No database connection free after {self.checkout_timeout}s")
+        waited = time.monotonic() - start
+        
+        conn = None
+        broken = False
+        try:
+            with self._lock:
+                self._stats['checkouts'] += 1
+                self._stats['in_use'] += 1
+                self._stats['wait_seconds_total'] += waited
+                self._stats['wait_seconds_max'] = max(self._stats['wait_seconds_max'], waited)
+            conn = self._checkout()
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            if conn is not None:
+                if broken or conn.closed:
+                    self._count('discarded')
+                    self._discard(conn)
+                else:
+                    with self._lock:
+                        self._last_used[conn] = time.monotonic()
+                        self._idle.append(conn)
+            self._count('in_use', -1)
+            self._slots.release()
+    
+    def prepared_statements(self, conn):
+        """Names of the statements prepared on a pooled connection"""
+        with self._lock:
+            return self._prepared.setdefault(conn, set())
+    
+    def stats(self):
+        """Pool size, usage and wait counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['idle'] = len(self._idle)
+        stats['min_connections'] = self.min_connections
+        stats['max_connections'] = self.max_connections
+        stats['avg_wait_ms'] = round(1000 * stats['wait_seconds_total'] / stats['checkouts'], 2) if stats['checkouts'] else 0.0
+        return stats
+    
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._discard(conn)
\ No newline at end of file
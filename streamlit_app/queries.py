@@ -0,0 +1,210 @@
+# queries.py
+"""
+Registry of the dashboard's SQL statements
+Each query is a named, parameterized statement, prepared once per pooled
+connection (PREPARE) and then run with bound parameters (EXECUTE)
+"""
+
+import threading
+import time
+from typing import NamedTuple
+import pandas as pd
+from config import CHART_RESOLUTIONS
+
+
+class Query(NamedTuple):
+    """SQL with $1..$n placeholders and the Postgres types of its parameters"""
+    sql: str
+    param_types: tuple = ()
+
+
+def chart_table(daily_table, resolution):
+    """Daily performance view, or the rollup table of the given resolution"""
+    if resolution == 'daily':
+        return daily_table
+    return f"performance.fct_index_performance_{resolution}"
+
+
+LATEST_METRICS_SQL = """
+    SELECT
+        index_code,
+        index_name,
+        as_of_date,
+        annual_return_pct AS "1Y Return %",
+        return_3y_annualized_pct AS "3Y CAGR %",
+        return_5y_annualized_pct AS "5Y CAGR %",
+        ytd_return_pct AS "YTD %",
+        volatility_252d_pct AS "Volatility %",
+        sharpe_ratio_1y AS "Sharpe Ratio",
+        max_drawdown_all_time_pct AS "Max Drawdown %",
+        days_since_ath AS "Days Since ATH"
+    FROM performance.fct_index_latest_snapshot
+"""
+
+QUERIES = {
+    # Precomputed one-row-per-index snapshot
+    'latest_metrics': Query(LATEST_METRICS_SQL + "ORDER BY index_name"),
+    
+    # Changes on every dbt build of the marts (cache version)
+    'data_version': Query("""
+    SELECT MAX(calculated_at) AS data_version
+    FROM performance.fct_index_latest_snapshot
+    """),
+    
+    # Set-based: one statement serves every index of the array in $1
+    'sector_weights': Query("""
+    SELECT
+        index_code,
+        sector,
+        sector_weight_pct,
+        company_count,
+        sector_avg_pe,
+        sector_avg_roe_pct
+    FROM analytics.fct_index_sector_weights
+    WHERE index_code = ANY($1)
+    ORDER BY index_code, sector_weight_pct DESC
+    """, ('text[]',)),
+    
+    'top_holdings': Query("""
+    SELECT
+        index_code,
+        holding_rank,
+        ticker,
+        company_name,
+        sector,
+        weight_pct,
+        market_cap_billions,
+        pe_ratio,
+        dividend_yield_pct
+    FROM analytics.fct_top10_holdings
+    WHERE index_code = ANY($1)
+    AND holding_rank <= $2
+    ORDER BY index_code, holding_rank
+    """, ('text[]', 'int')),
+    
+    'all_stocks': Query("""
+    SELECT
+        ticker,
+        company_name,
+        sector,
+        industry,
+        trailing_pe AS pe_ratio_trailing,
+        return_on_equity * 100 AS roe_pct,
+        dividend_yield * 100 AS dividend_yield_pct,
+        beta,
+        market_cap / 1000000000 AS market_cap_billions,
+        current_price
+    FROM gold.dim_stocks
+    WHERE is_current_constituent = TRUE
+    AND trailing_pe IS NOT NULL
+    AND trailing_pe > 0
+    ORDER BY market_cap DESC
+    """),
+}
+
+# Chart queries, one set-based statement per resolution (weekly/monthly
+# rollups have the daily views' column names)
+for resolution, _ in CHART_RESOLUTIONS:
+    # A rollup point is the period's trough, not its last day, so the
+    # deepest drawdown of the chart (and the Risk tab's maximum) matches
+    # the daily data
+    drawdown_column = (
+        'current_drawdown_from_ath_pct' if resolution == 'daily' else 'min_drawdown_from_ath_pct'
+    )
+    
+    QUERIES[f'index_performance_{resolution}'] = Query(f"""
+    SELECT
+        index_code,
+        price_date,
+        index_name,
+        close_price,
+        ytd_return_pct AS cumulative_return_pct
+    FROM {chart_table('performance.fct_index_returns', resolution)}
+    WHERE index_code = ANY($1)
+    AND price_date >= $2
+    ORDER BY index_code, price_date
+    """, ('text[]', 'date'))
+    
+    QUERIES[f'volatility_chart_{resolution}'] = Query(f"""
+    SELECT
+        index_code,
+        price_date,
+        index_name,
+        volatility_30d_pct,
+        volatility_90d_pct,
+        volatility_252d_pct
+    FROM {chart_table('performance.fct_index_volatility', resolution)}
+    WHERE index_code = ANY($1)
+    AND price_date >= $2
+    ORDER BY index_code, price_date
+    """, ('text[]', 'date'))
+    
+    QUERIES[f'drawdown_chart_{resolution}'] = Query(f"""
+    SELECT
+        index_code,
+        price_date,
+        index_name,
+        {drawdown_column} AS drawdown_from_peak_pct,
+        days_since_ath AS days_in_drawdown
+    FROM {chart_table('performance.fct_index_drawdown', resolution)}
+    WHERE index_code = ANY($1)
+    AND price_date >= $2
+    ORDER BY index_code, price_date
+    """, ('text[]', 'date'))
+
+
+# Per-query timings: PREPARE (once per connection) and EXECUTE. Postgres
+# plans the first executions of a statement individually before switching
+# to a cached generic plan, so planning cost shows up in the first
+# executions (execute_ms_max) and is amortized in execute_ms_avg.
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _record(name, key, seconds):
+    with _stats_lock:
+        stats = _stats.setdefault(name, {
+            'prepares': 0, 'prepare_ms_total': 0.0,
+            'executions': 0, 'execute_ms_total': 0.0, 'execute_ms_max': 0.0,
+        })
+        ms = seconds * 1000
+        if key == 'prepare':
+            stats['prepares'] += 1
+            stats['prepare_ms_total'] += ms
+        else:
+            stats['executions'] += 1
+            stats['execute_ms_total'] += ms
+            stats['execute_ms_max'] = max(stats['execute_ms_max'], ms)
+
+
+def run_query(pool, name, params=()):
+    """Execute a registered query on a pooled connection, preparing it first if needed"""
+    query = QUERIES[name]
+    with pool.connection() as conn:
+        prepared = pool.prepared_statements(conn)
+        with conn.cursor() as cur:
+            if name not in prepared:
+                start = time.perf_counter()
+                types = f" ({', '.join(query.param_types)})" if query.param_types else ""
+                cur.execute(f"PREPARE {name}{types} AS {query.sql}")
+                prepared.add(name)
+                _record(name, 'prepare', time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            placeholders = f" ({', '.join(['%s'] * len(params))})" if params else ""
+            cur.execute(f"EXECUTE {name}{placeholders}", tuple(params))
+            rows = cur.fetchall()
+            columns = [col[0] for col in cur.description]
+            _record(name, 'execute', time.perf_counter() - start)
+    
+    return pd.DataFrame(rows, columns=columns)
+
+
+def query_stats():
+    """Timings per registered query, as a DataFrame"""
+    with _stats_lock:
+        stats = {name: dict(values) for name, values in _stats.items()}
+    df = pd.DataFrame.from_dict(stats, orient='index')
+    if not df.empty:
+        df['execute_ms_avg'] = df['execute_ms_total'] / df['executions'].where(df['executions'] > 0)
+    return df.round(2)
\ No newline at end of file
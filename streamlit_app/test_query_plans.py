@@ -0,0 +1,69 @@
+# test_query_plans.py
+"""
+EXPLAIN checks of the dashboard queries against a built database
+Every query that filters by index must be able to read its mart through
+the indexes declared in financial_index_dbt/macros/physical_design.sql.
+Run from streamlit_app/ after `dbt build`: pytest test_query_plans.py
+"""
+
+from datetime import date
+import psycopg2
+import pytest
+from config import CHART_RESOLUTIONS, DB_CONFIG, INDICES, PERFORMANCE_INDEX_CODES
+from queries import QUERIES
+
+# Scans that read a table through one of its indexes
+INDEX_SCANS = {'Index Scan', 'Index Only Scan', 'Bitmap Heap Scan'}
+
+# Query -> (parameters, mart table whose indexes must serve it); the analytics
+# marts use the INDICES codes, the performance marts the price file codes
+PLAN_CHECKS = {
+    'sector_weights': ((list(INDICES),), 'fct_index_sector_weights'),
+    'top_holdings': ((list(INDICES), 10), 'fct_top10_holdings'),
+}
+for resolution, _ in CHART_RESOLUTIONS:
+    table = 'fct_index_performance' if resolution == 'daily' else f'fct_index_performance_{resolution}'
+    for chart in ('index_performance', 'volatility_chart', 'drawdown_chart'):
+        PLAN_CHECKS[f'{chart}_{resolution}'] = ((list(PERFORMANCE_INDEX_CODES), date(2020, 1, 1)), table)
+
+
+@pytest.fixture(scope='module')
+def cursor():
+    try:
+        conn = psycopg2.connect(**DB_CONFIG)
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"Database not reachable: {e}")
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        # The marts are small enough that the planner rightly prefers
+        # sequential scans; disabling them shows whether an index can serve
+        # the query at all
+        cur.execute("SET enable_seqscan = off")
+        yield cur
+    conn.close()
+
+
+def plan_scans(plan):
+    """(node type, relation) of every scan in an EXPLAIN (FORMAT JSON) plan"""
+    scans = []
+    if 'Relation Name' in plan:
+        scans.append((plan['Node Type'], plan['Relation Name']))
+    for child in plan.get('Plans', []):
+        scans.extend(plan_scans(child))
+    return scans
+
+
+@pytest.mark.parametrize('name', sorted(PLAN_CHECKS))
+def test_query_uses_mart_index(cursor, name):
+    params, table = PLAN_CHECKS[name]
+    query = QUERIES[name]
+    types = f" ({', '.join(query.param_types)})" if query.param_types else ""
+    
+    cursor.execute("DEALLOCATE ALL")
+    cursor.execute(f"PREPARE {name}{types} AS {query.sql}")
+    cursor.execute(f"EXPLAIN (FORMAT JSON) EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    plan = cursor.fetchone()[0][0]['Plan']
+    
+    scans = [node for node, relation in plan_scans(plan) if relation == table]
+    assert scans, f"{name} does not read {table}"
+    assert set(scans) <= INDEX_SCANS, f"{name} scans {table} with {scans}"
@@ -6,248 +6,216 @@ Database connections, queries, and chart generation
 
 # Load environment first
 from dotenv import load_dotenv
-import os
 load_dotenv()
 
 # Now import everything else
 import streamlit as st
 import pandas as pd
-import numpy as np
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import plotly.graph_objects as go
 import plotly.express as px
-from datetime import datetime
-from config import INDEX_COLORS, CHART_COLORS, DB_CONFIG, INDICES
+from concurrent.futures import ThreadPoolExecutor, wait
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from db_pool import DatabasePool
+from queries import run_query, query_stats
+from config import (
+    INDEX_COLORS, CHART_COLORS, DB_CONFIG, DB_POOL_CONFIG, INDICES, PERFORMANCE_INDICES, PERFORMANCE_INDEX_CODES,
+    CHART_RESOLUTIONS, MIN_CHART_POINTS, HISTORY_START_DATE, PERFORMANCE_PERIODS
+)
 
 # ==================== DATABASE FUNCTIONS ====================
 
 @st.cache_resource
-def get_database_connection():
-    """Create cached PostgreSQL connection"""
+def get_connection_pool():
+    """
+    Create the PostgreSQL connection pool shared by all sessions.
+    
+    Raises when the database is unreachable: st.cache_resource does not
+    cache exceptions, so the next rerun tries to connect again.
+    """
+    return DatabasePool(**DB_POOL_CONFIG, **DB_CONFIG)
+
+def get_pool_stats():
+    """Connection pool usage (checkouts, waits, reconnects)"""
     try:
-        conn = psycopg2.connect(
-            host=DB_CONFIG['host'],
-            database=DB_CONFIG['database'],
-            user=DB_CONFIG['user'],
-            password=DB_CONFIG['password'],
-            port=DB_CONFIG['port']
-        )
-        return conn
+        return get_connection_pool().stats()
     except Exception as e:
-        st.error(f"❌ Database connection failed: {e}")
-        return None
+        return {'error': f"❌ Database connection failed: {e}"}
+
+def get_query_stats():
+    """Prepare/execute timings of the registered dashboard queries"""
+    return query_stats()
+
+def chart_resolution(years=None):
+    """Coarsest resolution giving a chart over `years` (None: all history) enough points"""
+    if years is None:
+        span_days = (pd.Timestamp.now() - pd.Timestamp(HISTORY_START_DATE)).days
+    else:
+        span_days = years * 365.25
+    for resolution, days_per_point in CHART_RESOLUTIONS:
+        if span_days / days_per_point >= MIN_CHART_POINTS:
+            return resolution
+    return 'daily'
+
+# Set-based loaders: one query per table for every index, cached. They
+# raise on failure (so errors are not cached); the get_* functions below
+# slice one index out of them and report errors.
+
+@st.cache_data(ttl=60)
+def load_data_version():
+    """Build timestamp of the performance marts, used to version cached series"""
+    df = run_query(get_connection_pool(), 'data_version')
+    return str(df.iloc[0]['data_version'])
+
+def _slice(df, index_code):
+    """One index's rows of a set-based result, without the index_code column"""
+    return df[df['index_code'] == index_code].drop(columns='index_code').reset_index(drop=True)
 
 @st.cache_data(ttl=600)  # Cache for 10 minutes
-def get_latest_metrics(index_code=None):
-    """Get latest performance metrics for index/indices"""
-    conn = get_database_connection()
-    if not conn:
-        return pd.DataFrame()
-    
-    query = """
-    SELECT 
-        r.index_name,
-        r.annual_return_pct AS "1Y Return %",
-        r.return_3y_annualized_pct AS "3Y CAGR %",
-        r.return_5y_annualized_pct AS "5Y CAGR %",
-        r.ytd_return_pct AS "YTD %",
-        v.volatility_252d_pct AS "Volatility %",
-        s.sharpe_ratio_1y AS "Sharpe Ratio",
-        d.max_drawdown_all_time_pct AS "Max Drawdown %",
-        d.days_since_ath AS "Days Since ATH"
-    FROM performance.fct_index_returns r
-    JOIN performance.fct_index_volatility v 
-        ON r.price_date = v.price_date AND r.index_code = v.index_code
-    JOIN performance.fct_index_sharpe s
-        ON r.price_date = s.price_date AND r.index_code = s.index_code
-    JOIN performance.fct_index_drawdown d
-        ON r.price_date = d.price_date AND r.index_code = d.index_code
-    WHERE r.price_date = (SELECT MAX(price_date) FROM performance.fct_index_returns)
+def load_latest_metrics():
+    """Latest KPIs of every index"""
+    return run_query(get_connection_pool(), 'latest_metrics')
+
+@st.cache_data(max_entries=32)
+def load_index_series(index_codes, resolution, data_version):
     """
+    Full performance history of the indices at a resolution.
     
-    if index_code:
-        query += f" AND r.index_code = '{index_code}'"
-    
-    query += " ORDER BY r.index_name"
+    Cached per data version, so a dbt build invalidates it.
+    """
+    df = run_query(
+        get_connection_pool(),
+        f'index_performance_{resolution}',
+        (list(index_codes), pd.Timestamp(HISTORY_START_DATE).date())
+    )
+    df['price_date'] = pd.to_datetime(df['price_date'])
+    return df
+
+@st.cache_data(ttl=600)
+def load_all_stocks():
+    """Current constituents with fundamentals"""
+    return run_query(get_connection_pool(), 'all_stocks')
+
+@st.cache_data(ttl=600)
+def load_sector_weights(index_codes):
+    """Sector allocation of the indices"""
+    return run_query(get_connection_pool(), 'sector_weights', (list(index_codes),))
+
+@st.cache_data(ttl=600)
+def load_top_holdings(index_codes, n):
+    """Top n holdings of each index"""
+    return run_query(get_connection_pool(), 'top_holdings', (list(index_codes), int(n)))
+
+@st.cache_data(ttl=600)
+def load_risk_series(kind, index_codes, years):
+    """Volatility or drawdown chart series of the indices over the last `years`"""
+    start = (pd.Timestamp.now() - pd.DateOffset(years=years)).date()
+    df = run_query(get_connection_pool(), f'{kind}_chart_{chart_resolution(years)}', (list(index_codes), start))
+    df['price_date'] = pd.to_datetime(df['price_date'])
+    return df
+
+def prefetch_dashboard(top_n=10):
+    """
+    Load every dataset of a dashboard rerun concurrently over the pool.
     
+    Warms the loaders' caches with exactly the arguments the get_*
+    functions use, so a cold page costs about the slowest query rather
+    than the sum of all of them. The index series are loaded at every
+    resolution a period can map to, so switching periods is served from
+    the cache. Failures are left to the get_* calls.
+    """
+    resolutions = sorted({chart_resolution(years) for _, years in PERFORMANCE_PERIODS.values()})
+    tasks = [
+        (load_latest_metrics, ()),
+        *[(_prefetch_index_series, (resolution,)) for resolution in resolutions],
+        (load_all_stocks, ()),
+        (load_sector_weights, (tuple(INDICES),)),
+        (load_top_holdings, (tuple(INDICES), top_n)),
+        (load_risk_series, ('volatility', PERFORMANCE_INDEX_CODES, 2)),
+        (load_risk_series, ('drawdown', PERFORMANCE_INDEX_CODES, 5)),
+    ]
+    
+    # Worker threads share the session's script context, so st.cache_data
+    # behaves as in the script thread
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=len(tasks),
+        initializer=add_script_run_ctx,
+        initargs=(None, ctx)
+    ) as executor:
+        wait([executor.submit(fn, *args) for fn, args in tasks])
+
+def _prefetch_index_series(resolution):
+    load_index_series(PERFORMANCE_INDEX_CODES, resolution, load_data_version())
+
+def get_latest_metrics(index_code=None):
+    """Get latest performance metrics for index/indices (performance mart codes, e.g. 'SP500')"""
     try:
-        df = pd.read_sql(query, conn)
-        return df
+        df = load_latest_metrics()
     except Exception as e:
         st.error(f"Query failed: {e}")
         return pd.DataFrame()
-
-@st.cache_data(ttl=600)
-def get_index_performance(index_code, start_date=None):
-    """Get historical performance data for line chart"""
-    conn = get_database_connection()
-    if not conn:
-        return pd.DataFrame()
-    
-    query = f"""
-    SELECT 
-        price_date,
-        index_name,
-        close_price,
-        ytd_return_pct AS cumulative_return_pct
-    FROM performance.fct_index_returns
-    WHERE index_code = '{index_code}'
-    """
-    
-    if start_date:
-        query += f" AND price_date >= '{start_date}'"
     
-    query += " ORDER BY price_date"
+    # dim_indices names the constituent codes, so name the price series here
+    df = df.assign(index_name=df['index_code'].map(PERFORMANCE_INDICES).fillna(df['index_name']))
+    if index_code:
+        return _slice(df, index_code)
+    order = df['index_code'].map({code: i for i, code in enumerate(PERFORMANCE_INDEX_CODES)})
+    return df.iloc[order.argsort()].drop(columns='index_code').reset_index(drop=True)
+
+def get_index_performance(index_code, period='ALL'):
+    """Get historical performance data for line chart over a period key ('1Y', '3Y', ... 'ALL')"""
+    years = PERFORMANCE_PERIODS[period][1]
     
+    # Weekly/monthly rollups for long ranges (same column names)
     try:
-        df = pd.read_sql(query, conn)
-        df['price_date'] = pd.to_datetime(df['price_date'])
-        return df
+        df = load_index_series(PERFORMANCE_INDEX_CODES, chart_resolution(years), load_data_version())
     except Exception as e:
         st.error(f"Query failed: {e}")
         return pd.DataFrame()
+    
+    # Slice in memory, relative to the latest date of the series
+    df = _slice(df, index_code)
+    if years is None or df.empty:
+        return df
+    start = df['price_date'].max() - pd.DateOffset(years=years)
+    return df[df['price_date'] >= start]
 
-@st.cache_data(ttl=600)
 def get_sector_weights(index_code):
     """Get sector allocation for pie/bar chart"""
-    conn = get_database_connection()
-    if not conn:
-        return pd.DataFrame()
-    
-    query = f"""
-    SELECT 
-        sector,
-        sector_weight_pct,
-        company_count,
-        sector_avg_pe,
-        sector_avg_roe_pct
-    FROM analytics.fct_index_sector_weights
-    WHERE index_code = '{index_code}'
-    ORDER BY sector_weight_pct DESC
-    """
-    
     try:
-        df = pd.read_sql(query, conn)
-        return df
+        return _slice(load_sector_weights(tuple(INDICES)), index_code)
     except Exception as e:
         st.error(f"Query failed: {e}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=600)
 def get_top_holdings(index_code, n=10):
     """Get top N holdings"""
-    conn = get_database_connection()
-    if not conn:
-        return pd.DataFrame()
-    
-    query = f"""
-    SELECT 
-        holding_rank,
-        ticker,
-        company_name,
-        sector,
-        weight_pct,
-        market_cap_billions,
-        pe_ratio,
-        dividend_yield_pct
-    FROM analytics.fct_top10_holdings
-    WHERE index_code = '{index_code}'
-    ORDER BY holding_rank
-    LIMIT {n}
-    """
-    
     try:
-        df = pd.read_sql(query, conn)
-        return df
+        return _slice(load_top_holdings(tuple(INDICES), n), index_code)
     except Exception as e:
         st.error(f"Query failed: {e}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=600)
 def get_all_stocks():
     """Get all stocks with fundamentals for screener"""
-    conn = get_database_connection()
-    if not conn:
-        return pd.DataFrame()
-    
-    query = """
-    SELECT 
-        ticker,
-        company_name,
-        sector,
-        industry,
-        trailing_pe AS pe_ratio_trailing,
-        return_on_equity * 100 AS roe_pct,
-        dividend_yield * 100 AS dividend_yield_pct,
-        beta,
-        market_cap / 1000000000 AS market_cap_billions,
-        current_price
-    FROM gold.dim_stocks
-    WHERE is_current_constituent = TRUE
-    AND trailing_pe IS NOT NULL
-    AND trailing_pe > 0
-    ORDER BY market_cap DESC
-    """
-    
     try:
-        df = pd.read_sql(query, conn)
-        return df
+        return load_all_stocks()
     except Exception as e:
         st.error(f"Query failed: {e}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=600)
 def get_volatility_chart_data(index_code):
     """Get rolling volatility for chart"""
-    conn = get_database_connection()
-    if not conn:
-        return pd.DataFrame()
-    
-    query = f"""
-    SELECT 
-        price_date,
-        index_name,
-        volatility_30d_pct,
-        volatility_90d_pct,
-        volatility_252d_pct
-    FROM performance.fct_index_volatility
-    WHERE index_code = '{index_code}'
-    AND price_date >= CURRENT_DATE - INTERVAL '2 years'
-    ORDER BY price_date
-    """
-    
     try:
-        df = pd.read_sql(query, conn)
-        df['price_date'] = pd.to_datetime(df['price_date'])
-        return df
+        return _slice(load_risk_series('volatility', PERFORMANCE_INDEX_CODES, 2), index_code)
     except Exception as e:
         st.error(f"Query failed: {e}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=600)
 def get_drawdown_chart_data(index_code):
     """Get drawdown data for chart"""
-    conn = get_database_connection()
-    if not conn:
-        return pd.DataFrame()
-    
-    query = f"""
-    SELECT 
-        price_date,
-        index_name,
-        current_drawdown_from_ath_pct AS drawdown_from_peak_pct,
-        days_since_ath AS days_in_drawdown
-    FROM performance.fct_index_drawdown
-    WHERE index_code = '{index_code}'
-    AND price_date >= CURRENT_DATE - INTERVAL '5 years'
-    ORDER BY price_date
-    """
-    
     try:
-        df = pd.read_sql(query, conn)
-        df['price_date'] = pd.to_datetime(df['price_date'])
-        return df
+        return _slice(load_risk_series('drawdown', PERFORMANCE_INDEX_CODES, 5), index_code)
     except Exception as e:
         st.error(f"Query failed: {e}")
         return pd.DataFrame()
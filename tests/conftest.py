@@ -0,0 +1,12 @@
+# tests/conftest.py
+"""
+Puts dagster_project/ on the import path, so tests import its plain-Python
+modules (e.g. acquisition.fundamentals) the way test_connection.py imports
+resources.database, without running dagster_project/__init__.py (which
+builds the Dagster Definitions from the dbt manifest and .env).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dagster_project"))
@@ -0,0 +1,121 @@
+# tests/test_fundamentals_acquisition.py
+"""
+Tests of the fundamentals fetching against a local stub HTTP server.
+Run from the repository root: pytest
+"""
+
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from acquisition.fundamentals import (
+    TokenBucket,
+    fetch_ticker_valuation,
+    fetch_valuations,
+    http_fetcher,
+)
+
+
+# Ticker -> (status, body) served by the stub; FLAKY is rate limited once
+RESPONSES = {
+    "AAPL": (200, json.dumps({"symbol": "AAPL", "shortName": "Apple Inc.", "trailingPE": 32.5})),
+    "BADJSON": (200, "<html>not json</html>"),
+    "NULL": (200, "null"),
+    "EMPTY": (200, "{}"),
+    "GONE": (404, "Not Found"),
+    "DOWN": (503, "Service Unavailable"),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    requests = Counter()
+    lock = threading.Lock()
+    
+    def do_GET(self):
+        ticker = self.path.rsplit("/", 1)[-1]
+        with self.lock:
+            self.requests[ticker] += 1
+            count = self.requests[ticker]
+        
+        if ticker == "FLAKY":
+            status, body = (429, "Too Many Requests") if count == 1 else (200, json.dumps({"symbol": "FLAKY"}))
+        else:
+            status, body = RESPONSES.get(ticker, (404, "Not Found"))
+        
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    StubHandler.requests.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def fetch(stub_url, ticker, max_retries=3):
+    return fetch_ticker_valuation(
+        ticker,
+        http_fetcher(stub_url, timeout=5),
+        TokenBucket(rate=1000, capacity=1000),
+        max_retries=max_retries,
+        backoff_seconds=0.01
+    )
+
+
+def test_valid_ticker(stub_url):
+    valuation, error, attempts = fetch(stub_url, "AAPL")
+    assert error is None
+    assert attempts == 1
+    assert valuation["ticker"] == "AAPL"
+    assert valuation["trailingPE"] == 32.5
+    assert valuation["forwardPE"] is None
+
+
+def test_rate_limited_ticker_is_retried(stub_url):
+    valuation, error, attempts = fetch(stub_url, "FLAKY")
+    assert error is None
+    assert attempts == 2
+    assert valuation["symbol"] == "FLAKY"
+
+
+@pytest.mark.parametrize("ticker", ["BADJSON", "NULL", "EMPTY", "GONE"])
+def test_bad_ticker_fails_without_retries(stub_url, ticker):
+    valuation, error, attempts = fetch(stub_url, ticker)
+    assert valuation is None
+    assert error
+    assert attempts == 1
+    assert StubHandler.requests[ticker] == 1
+
+
+def test_transient_error_gives_up_after_max_retries(stub_url):
+    valuation, error, attempts = fetch(stub_url, "DOWN", max_retries=2)
+    assert valuation is None
+    assert error.startswith("HTTP 503")
+    assert attempts == 3
+
+
+def test_bad_tickers_do_not_abort_the_pool(stub_url):
+    tickers = ["AAPL", "BADJSON", "NULL", "EMPTY", "GONE", "FLAKY"]
+    results = fetch_valuations(
+        tickers,
+        http_fetcher(stub_url, timeout=5),
+        TokenBucket(rate=1000, capacity=1000),
+        max_workers=4,
+        max_retries=3,
+        backoff_seconds=0.01
+    )
+    
+    fetched = [ticker for ticker, (valuation, _, _) in zip(tickers, results) if valuation is not None]
+    assert fetched == ["AAPL", "FLAKY"]
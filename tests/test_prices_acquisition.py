@@ -0,0 +1,207 @@
+# tests/test_prices_acquisition.py
+"""
+Tests of the index price fetching against a local mock of the EODHD
+end-of-day API.
+Run from the repository root: pytest
+"""
+
+import hashlib
+import json
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pandas as pd
+import pytest
+from acquisition.http_cache import HttpCache
+from acquisition.prices import fetch_range, find_gaps, merge_prices, read_price_file
+
+
+TODAY = date.today()
+
+# Symbol -> {ISO date: close} served by the mock
+CLOSES = {
+    "GSPC.INDX": {
+        "2020-01-02": 3257.85,
+        "2020-01-03": 3234.85,
+        "2020-01-06": 3246.28,
+        "2020-01-07": 3237.18,
+        "2020-01-08": 3255.00,
+        "2020-01-09": 3274.70,
+    },
+    "OEX.INDX": {
+        (TODAY - timedelta(days=1)).isoformat(): 1500.0,
+        TODAY.isoformat(): 1510.0,
+    },
+}
+
+
+class EodhdHandler(BaseHTTPRequestHandler):
+    requests = []
+    lock = threading.Lock()
+    
+    def do_GET(self):
+        url = urlparse(self.path)
+        symbol = url.path.rsplit("/", 1)[-1]
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        with self.lock:
+            self.requests.append((symbol, params, self.headers.get("If-None-Match")))
+        
+        if not url.path.startswith("/api/eod/") or symbol not in CLOSES:
+            self.send_response(404)
+            self.end_headers()
+            return
+        
+        rows = [
+            {"date": day, "close": close}
+            for day, close in sorted(CLOSES[symbol].items())
+            if params["from"] <= day <= params["to"]
+        ]
+        body = json.dumps(rows).encode("utf-8")
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def eodhd_url():
+    EodhdHandler.requests.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EodhdHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api"
+    server.shutdown()
+    server.server_close()
+
+
+def weekdays(start, end, skip=()):
+    days = pd.bdate_range(start, end).difference(pd.to_datetime(list(skip)))
+    return pd.Series(days.date)
+
+
+def test_find_gaps_interior_and_trailing():
+    # A missing week is a gap; a lone missing weekday is a market holiday
+    dates = weekdays("2020-01-02", "2020-03-31", skip=pd.bdate_range("2020-02-03", "2020-02-07").union(["2020-02-17"]))
+    
+    assert find_gaps(dates, date(2020, 1, 2), date(2020, 4, 10)) == [
+        (date(2020, 2, 3), date(2020, 2, 7)),
+        (date(2020, 4, 1), date(2020, 4, 10)),
+    ]
+
+
+def test_find_gaps_head_and_empty_history():
+    dates = weekdays("2020-01-06", "2020-01-10")
+    
+    assert find_gaps(dates, date(2019, 12, 31), date(2020, 1, 10)) == [(date(2019, 12, 31), date(2020, 1, 5))]
+    assert find_gaps(dates.iloc[0:0], date(2019, 12, 31), date(2020, 1, 10)) == [(date(2019, 12, 31), date(2020, 1, 10))]
+
+
+def test_find_gaps_skips_weekend_only_tail():
+    # History ends on a Friday; nothing to fetch before Monday
+    assert find_gaps(weekdays("2020-01-02", "2020-01-03"), date(2020, 1, 2), date(2020, 1, 5)) == []
+
+
+def test_find_gaps_lookback_refetches_recent_days():
+    dates = weekdays("2020-01-02", "2020-01-31")
+    
+    assert find_gaps(dates, date(2020, 1, 2), date(2020, 2, 3), lookback_days=5) == [
+        (date(2020, 1, 27), date(2020, 2, 3)),
+    ]
+
+
+def test_past_range_is_served_from_cache(eodhd_url, tmp_path):
+    cache = HttpCache(str(tmp_path), ttl_seconds=0)
+    
+    first = fetch_range(cache, eodhd_url, "GSPC.INDX", date(2020, 1, 2), date(2020, 1, 9), 0, 5)
+    second = fetch_range(cache, eodhd_url, "GSPC.INDX", date(2020, 1, 2), date(2020, 1, 9), 0, 5)
+    
+    assert len(first) == 6
+    pd.testing.assert_frame_equal(first, second)
+    assert len(EodhdHandler.requests) == 1
+    assert cache.stats() == {"cache_hits": 1, "cache_revalidated": 0, "cache_misses": 1, "api_calls": 1}
+
+
+def test_stale_range_is_revalidated_with_etag(eodhd_url, tmp_path):
+    cache = HttpCache(str(tmp_path), ttl_seconds=0)
+    start = TODAY - timedelta(days=7)
+    
+    first = fetch_range(cache, eodhd_url, "OEX.INDX", start, TODAY, 0, 5)
+    second = fetch_range(cache, eodhd_url, "OEX.INDX", start, TODAY, 0, 5)
+    
+    pd.testing.assert_frame_equal(first, second)
+    assert len(first) == 2
+    (_, _, first_etag), (_, _, second_etag) = EodhdHandler.requests
+    assert first_etag is None
+    assert second_etag is not None
+    assert cache.stats() == {"cache_hits": 0, "cache_revalidated": 1, "cache_misses": 1, "api_calls": 2}
+
+
+def test_api_token_is_sent_but_not_part_of_the_cache_key(eodhd_url, tmp_path, monkeypatch):
+    cache = HttpCache(str(tmp_path), ttl_seconds=0)
+    
+    monkeypatch.setenv("EODHD_API_TOKEN", "first-token")
+    fetch_range(cache, eodhd_url, "GSPC.INDX", date(2020, 1, 2), date(2020, 1, 9), 0, 5)
+    monkeypatch.setenv("EODHD_API_TOKEN", "second-token")
+    fetch_range(cache, eodhd_url, "GSPC.INDX", date(2020, 1, 2), date(2020, 1, 9), 0, 5)
+    
+    assert [params["api_token"] for _, params, _ in EodhdHandler.requests] == ["first-token"]
+    assert all("token" not in path.read_text() for path in tmp_path.iterdir())
+
+
+def test_merge_into_existing_file_without_duplicates(eodhd_url, tmp_path):
+    # Existing file: timezone-aware timestamps, a revised close on 2020-01-06
+    path = tmp_path / "index_prices_base100.csv"
+    pd.DataFrame({
+        "date": ["2020-01-02 00:00:00-05:00", "2020-01-03 00:00:00-05:00", "2020-01-06 00:00:00-05:00"],
+        "index_name": "S&P 500",
+        "close": [3257.85, 3234.85, 3240.00],
+        "base_100": [100.0, 3234.85 / 3257.85 * 100, 3240.00 / 3257.85 * 100],
+    }).to_csv(path, index=False)
+    existing = read_price_file(str(path))
+    
+    cache = HttpCache(str(tmp_path / "cache"), ttl_seconds=0)
+    gaps = find_gaps(existing["date"], date(2020, 1, 2), date(2020, 1, 9), lookback_days=2)
+    assert gaps == [(date(2020, 1, 3), date(2020, 1, 9))]
+    fetched = pd.concat([
+        fetch_range(cache, eodhd_url, "GSPC.INDX", a, b, 0, 5).assign(index_name="S&P 500") for a, b in gaps
+    ])
+    
+    merged, changed_dates = merge_prices(existing, fetched)
+    
+    assert not merged.duplicated(subset=["date", "index_name"]).any()
+    assert merged["date"].tolist() == [date.fromisoformat(day) for day in CLOSES["GSPC.INDX"]]
+    assert merged["close"].tolist() == list(CLOSES["GSPC.INDX"].values())
+    assert merged["base_100"].iloc[0] == 100.0
+    # The overlapping 2020-01-03 is unchanged; the revised and new days are reported
+    assert changed_dates == [date(2020, 1, 6), date(2020, 1, 7), date(2020, 1, 8), date(2020, 1, 9)]
+    
+    unchanged, no_dates = merge_prices(merged, fetched)
+    assert no_dates == []
+    pd.testing.assert_frame_equal(unchanged, merged)
+
+
+
+def test_first_run_merges_into_missing_file(eodhd_url, tmp_path):
+    existing = read_price_file(str(tmp_path / "index_prices_base100.csv"))
+    cache = HttpCache(str(tmp_path / "cache"), ttl_seconds=0)
+    
+    fetched = fetch_range(cache, eodhd_url, "GSPC.INDX", date(2020, 1, 2), date(2020, 1, 9), 0, 5)
+    merged, changed_dates = merge_prices(existing, fetched.assign(index_name="S&P 500"))
+    
+    assert len(merged) == 6
+    assert changed_dates == [date.fromisoformat(day) for day in CLOSES["GSPC.INDX"]]
+    
+    nothing, no_dates = merge_prices(existing, existing)
+    assert nothing.empty
+    assert no_dates == []
\ No newline at end of file